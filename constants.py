@@ -0,0 +1,24 @@
+"""
+공용 상수
+여러 스크립트에서 함께 사용하는 NASDAQ 100 종목 목록
+"""
+
+from typing import FrozenSet, Tuple
+
+# NASDAQ 100 심볼 (시가총액 순서 유지 - 뉴스 수집 시 상위 종목 선택에 사용)
+NASDAQ_100: Tuple[str, ...] = (
+    "NVDA", "MSFT", "AAPL", "GOOG", "GOOGL", "AMZN", "META", "AVGO", "TSLA",
+    "NFLX", "PLTR", "COST", "ASML", "AMD", "CSCO", "AZN", "TMUS", "MU", "LIN",
+    "PEP", "SHOP", "APP", "INTU", "AMAT", "LRCX", "PDD", "QCOM", "ARM", "INTC",
+    "BKNG", "AMGN", "TXN", "ISRG", "GILD", "KLAC", "PANW", "ADBE", "HON",
+    "CRWD", "CEG", "ADI", "ADP", "DASH", "CMCSA", "VRTX", "MELI", "SBUX",
+    "CDNS", "ORLY", "SNPS", "MSTR", "MDLZ", "ABNB", "MRVL", "CTAS", "TRI",
+    "MAR", "MNST", "CSX", "ADSK", "PYPL", "FTNT", "AEP", "WDAY", "REGN", "ROP",
+    "NXPI", "DDOG", "AXON", "ROST", "IDXX", "EA", "PCAR", "FAST", "EXC", "TTWO",
+    "XEL", "ZS", "PAYX", "WBD", "BKR", "CPRT", "CCEP", "FANG", "TEAM", "CHTR",
+    "KDP", "MCHP", "GEHC", "VRSK", "CTSH", "CSGP", "KHC", "ODFL", "DXCM", "TTD",
+    "ON", "BIIB", "LULU", "CDW", "GFS"
+)
+
+# 멤버십 검사용
+NASDAQ_100_SET: FrozenSet[str] = frozenset(NASDAQ_100)
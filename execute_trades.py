@@ -6,13 +6,16 @@ Claude Code Action의 결정을 받아서 실제 거래를 실행
 """
 
 import os
-import json
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+import numpy as np
 from dotenv import load_dotenv
 
+from constants import NASDAQ_100
+from json_utils import json_loads, json_dumps
+
 # .env 파일 로드
 load_dotenv()
 
@@ -61,40 +64,28 @@ class TradeExecutor:
             print("🎯 Trading Mode: Simulation")
 
         # NASDAQ 100 심볼
-        self.symbols = [
-            "NVDA", "MSFT", "AAPL", "GOOG", "GOOGL", "AMZN", "META", "AVGO", "TSLA",
-            "NFLX", "PLTR", "COST", "ASML", "AMD", "CSCO", "AZN", "TMUS", "MU", "LIN",
-            "PEP", "SHOP", "APP", "INTU", "AMAT", "LRCX", "PDD", "QCOM", "ARM", "INTC",
-            "BKNG", "AMGN", "TXN", "ISRG", "GILD", "KLAC", "PANW", "ADBE", "HON",
-            "CRWD", "CEG", "ADI", "ADP", "DASH", "CMCSA", "VRTX", "MELI", "SBUX",
-            "CDNS", "ORLY", "SNPS", "MSTR", "MDLZ", "ABNB", "MRVL", "CTAS", "TRI",
-            "MAR", "MNST", "CSX", "ADSK", "PYPL", "FTNT", "AEP", "WDAY", "REGN", "ROP",
-            "NXPI", "DDOG", "AXON", "ROST", "IDXX", "EA", "PCAR", "FAST", "EXC", "TTWO",
-            "XEL", "ZS", "PAYX", "WBD", "BKR", "CPRT", "CCEP", "FANG", "TEAM", "CHTR",
-            "KDP", "MCHP", "GEHC", "VRSK", "CTSH", "CSGP", "KHC", "ODFL", "DXCM", "TTD",
-            "ON", "BIIB", "LULU", "CDW", "GFS"
-        ]
+        self.symbols = list(NASDAQ_100)
 
     def get_latest_position(self) -> tuple[Dict[str, float], int, str, str]:
-        """최신 포지션 조회 (datetime 기준으로 정렬)"""
+        """최신 포지션 조회 (datetime 기준 최신 문서)"""
         if not self.position_file.exists():
             return {}, -1, None, None
 
-        positions = []
-        with open(self.position_file, "r") as f:
+        # datetime 기준 최신 문서를 한 번의 스캔으로 선택 (같은 값이면 나중 줄 우선)
+        latest = None
+        latest_key = ""
+        with open(self.position_file, "rb") as f:
             for line in f:
                 if not line.strip():
                     continue
-                doc = json.loads(line)
-                positions.append(doc)
+                doc = json_loads(line)
+                key = doc.get("datetime", doc.get("date", ""))
+                if latest is None or key >= latest_key:
+                    latest, latest_key = doc, key
 
-        if not positions:
+        if latest is None:
             return {}, -1, None, None
 
-        # datetime 기준으로 정렬하여 최신 것 선택
-        positions.sort(key=lambda x: x.get("datetime", x.get("date", "")))
-        latest = positions[-1]
-
         return (
             latest.get("positions", {}),
             latest.get("id", -1),
@@ -109,11 +100,11 @@ class TradeExecutor:
         if not merged_file.exists():
             return None
 
-        with open(merged_file, "r") as f:
+        with open(merged_file, "rb") as f:
             for line in f:
                 if not line.strip():
                     continue
-                doc = json.loads(line)
+                doc = json_loads(line)
                 meta = doc.get("Meta Data", {})
 
                 if meta.get("2. Symbol") != symbol:
@@ -127,6 +118,31 @@ class TradeExecutor:
 
         return None
 
+    def get_open_prices(self, date: str) -> Dict[str, float]:
+        """merged.jsonl을 한 번만 읽어 해당 날짜의 모든 종목 시가 조회"""
+        merged_file = self.data_path / "merged.jsonl"
+        prices = {}
+
+        if not merged_file.exists():
+            return prices
+
+        with open(merged_file, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                doc = json_loads(line)
+                symbol = doc.get("Meta Data", {}).get("2. Symbol")
+
+                # get_price와 동일하게 처음 매칭된 데이터 사용
+                if not symbol or symbol in prices:
+                    continue
+
+                day_data = doc.get("Time Series (Daily)", {}).get(date)
+                if day_data:
+                    prices[symbol] = float(day_data.get("1. buy price", 0))
+
+        return prices
+
     def execute_trade(
         self,
         action: str,
@@ -202,14 +218,14 @@ class TradeExecutor:
             action_data["slippage"] = actual_price - reference_price
             action_data["slippage_pct"] = ((actual_price - reference_price) / reference_price * 100) if reference_price > 0 else 0
 
-        with open(self.position_file, "a") as f:
-            f.write(json.dumps({
+        with open(self.position_file, "ab") as f:
+            f.write(json_dumps({
                 "datetime": trading_datetime,
                 "date": date,
                 "id": current_id + 1,
                 "this_action": action_data,
                 "positions": new_position
-            }) + "\n")
+            }, append_newline=True))
 
         mode_indicator = "🔴" if self.use_alpaca else "🔵"
         return True, new_position, f"{mode_indicator} {action} {amount} shares of {symbol} at ${actual_price:.2f}", actual_price
@@ -227,16 +243,14 @@ class TradeExecutor:
         """Claude의 결정을 실행"""
         # Claude 결정 로드
         try:
-            with open(decision_file, "r") as f:
-                decision = json.load(f)
+            decision = json_loads(Path(decision_file).read_bytes())
         except Exception as e:
             print(f"❌ Failed to load decision file: {e}")
             return
 
         # 트레이딩 데이터 로드
         try:
-            with open(trading_data_file, "r") as f:
-                trading_data = json.load(f)
+            trading_data = json_loads(Path(trading_data_file).read_bytes())
         except Exception as e:
             print(f"❌ Failed to load trading data: {e}")
             return
@@ -260,8 +274,8 @@ class TradeExecutor:
             print("\n📊 No trades (HOLD)")
             # 거래 없음 기록 - position 파일에도 기록하여 git 변경사항 발생
             self.position_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.position_file, "a") as f:
-                f.write(json.dumps({
+            with open(self.position_file, "ab") as f:
+                f.write(json_dumps({
                     "datetime": trading_datetime,
                     "date": date,
                     "id": current_id + 1,
@@ -273,7 +287,7 @@ class TradeExecutor:
                         "mode": "alpaca" if self.use_alpaca else "simulation"
                     },
                     "positions": current_position
-                }) + "\n")
+                }, append_newline=True))
         else:
             print(f"\n📈 Executing {len(actions)} trades:")
 
@@ -301,15 +315,15 @@ class TradeExecutor:
                 else:
                     print(f"  {i}. ❌ {action.upper()} {amount} {symbol} - {message}")
 
-        # 최종 포트폴리오 가치 계산
-        total_value = current_position.get("CASH", 0)
-
-        for symbol in self.symbols:
-            shares = current_position.get(symbol, 0)
-            if shares > 0:
-                price = self.get_price(symbol, date)
-                if price:
-                    total_value += shares * price
+        # 최종 포트폴리오 가치 계산 (보유 수량 × 시가를 벡터 연산으로 처리)
+        open_prices = self.get_open_prices(date)
+        symbol_count = len(self.symbols)
+        position_get = current_position.get
+        price_get = open_prices.get
+        shares_np = np.fromiter((position_get(s, 0) for s in self.symbols), dtype=np.float64, count=symbol_count)
+        prices_np = np.fromiter((price_get(s, 0.0) for s in self.symbols), dtype=np.float64, count=symbol_count)
+        held = shares_np > 0
+        total_value = current_position.get("CASH", 0) + float((shares_np[held] * prices_np[held]).sum())
 
         print(f"\n💰 End of Session Portfolio Value: ${total_value:.2f}")
         print(f"   Cash: ${current_position.get('CASH', 0):.2f}")
@@ -320,14 +334,13 @@ class TradeExecutor:
         log_file = self.log_dir / date / f"trading_log_{safe_datetime}.json"
         log_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(log_file, "w") as f:
-            json.dump({
-                "datetime": trading_datetime,
-                "date": date,
-                "decision": decision,
-                "final_value": total_value,
-                "final_position": current_position
-            }, f, indent=2)
+        log_file.write_bytes(json_dumps({
+            "datetime": trading_datetime,
+            "date": date,
+            "decision": decision,
+            "final_value": total_value,
+            "final_position": current_position
+        }, indent=True))
 
         print(f"\n✅ Log saved to: {log_file}")
 
@@ -358,8 +371,7 @@ def main():
     # Alpaca 모드에서 날짜 검증
     if not simulation_mode and use_alpaca:
         try:
-            with open(trading_data_file, "r") as f:
-                trading_data = json.load(f)
+            trading_data = json_loads(Path(trading_data_file).read_bytes())
 
             trading_date = trading_data.get("date")
             today = datetime.now().strftime("%Y-%m-%d")
@@ -6,16 +6,32 @@ yfinance를 사용하여 종목별 뉴스 수집
 
 import os
 import sys
-import json
+import functools
+import hashlib
+import logging
+import random
+import time
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import re
 from dotenv import load_dotenv
 import yfinance as yf
 import xml.etree.ElementTree as ET
 
+from constants import NASDAQ_100
+from json_utils import json_loads, json_dumps
+
+# defusedxml이 있으면 안전한 XML 파서 사용 (엔티티 확장 공격 방지)
+try:
+    from defusedxml.ElementTree import fromstring as xml_fromstring
+except ImportError:
+    xml_fromstring = ET.fromstring
+
 # Windows 환경에서 UTF-8 출력 설정
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
@@ -23,6 +39,56 @@ if sys.platform == 'win32':
 # .env 파일 로드
 load_dotenv()
 
+# 뉴스 수집 로거 (핸들러는 main에서 한 번만 설정)
+logger = logging.getLogger('news')
+
+# 상대 시간 표현: "4 hours ago", "1 day ago"
+_AGO_RE = re.compile(r'(\d+)\s*(hour|day|week|month)s?\s*ago', re.I)
+_AGO_UNITS = {
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+    'month': timedelta(days=30),
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _standardize_date(date_str: str, now: datetime) -> str:
+    """parse_date_to_standard 본체 (같은 배치 내 반복되는 날짜 문자열은 캐시 사용)"""
+    try:
+        # 상대 시간 처리: "4 hours ago", "1 day ago"
+        match = _AGO_RE.search(date_str)
+        if match:
+            value, unit = int(match[1]), match[2].lower()
+            target_date = now - _AGO_UNITS[unit] * value
+            return target_date.strftime('%Y-%m-%d %H:%M:%S')
+        if 'ago' in date_str.lower():
+            return now.strftime('%Y-%m-%d %H:%M:%S')
+
+        # ISO 8601 형식: "2025-10-01T08:19:28+00:00"
+        if 'T' in date_str:
+            date_part = date_str.split('+')[0].split('-')[0:3]
+            date_part = '-'.join(date_part[:3])
+            if len(date_part.split('T')) > 1:
+                parsed_date = datetime.strptime(date_part, '%Y-%m-%dT%H:%M:%S')
+            else:
+                parsed_date = datetime.strptime(date_part, '%Y-%m-%d')
+            return parsed_date.strftime('%Y-%m-%d %H:%M:%S')
+
+        # 일반 형식: "May 31, 2025" 또는 "2025-05-31"
+        if ',' in date_str:
+            parsed_date = datetime.strptime(date_str.strip(), '%b %d, %Y')
+        elif '-' in date_str and len(date_str) == 10:
+            parsed_date = datetime.strptime(date_str, '%Y-%m-%d')
+        else:
+            return now.strftime('%Y-%m-%d %H:%M:%S')
+
+        return parsed_date.strftime('%Y-%m-%d %H:%M:%S')
+
+    except Exception as e:
+        logger.warning(f"⚠️ Date parsing error for '{date_str}': {e}")
+        return now.strftime('%Y-%m-%d %H:%M:%S')
+
 
 class MarketNewsCollector:
     """Jina AI를 사용한 시장 뉴스 수집 클래스"""
@@ -34,79 +100,151 @@ class MarketNewsCollector:
     NASDAQ_STOCK_RSS_URL_TEMPLATE = "https://www.nasdaq.com/feed/rssoutbound?symbol={symbol}"
     SEMICONDUCTOR_RSS_URL = "https://www.semiconductor-today.com/rss/news.xml"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # RSS 응답 최대 크기 (초과 시 파싱하지 않음)
+    MAX_RSS_CONTENT_LENGTH = 5_000_000
+    RSS_CHUNK_SIZE = 64 * 1024
+
+    # Jina Reader 본문 최대 길이 (문자 수)
+    READER_MAX_CONTENT_CHARS = 2000
+
+    # Jina API 동시 요청 수 (요금제 rate limit 고려)
+    JINA_MAX_WORKERS = 5
+
+    # 종목별 뉴스(yfinance + NASDAQ RSS) 동시 요청 수
+    STOCK_NEWS_MAX_WORKERS = 5
+
+    # Jina API 재시도 정책 (지수 백오프 + jitter)
+    RETRY_MAX_TRIES = 4
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 30.0
+    RETRY_JITTER = 0.5
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+    RATE_LIMIT_LOW_RATIO = 0.1
+
+    def __init__(self, api_key: Optional[str] = None, cache_dir: Optional[str] = None):
         self.api_key = api_key or os.getenv("JINA_API_KEY")
         self.has_jina_api = bool(self.api_key)
 
         if not self.has_jina_api:
-            print("⚠️ JINA_API_KEY not found - will skip market/sector news collection")
-            print("   Only stock-specific news (via yfinance) will be collected")
+            logger.warning("⚠️ JINA_API_KEY not found - will skip market/sector news collection")
+            logger.info("   Only stock-specific news (via yfinance) will be collected")
 
         self.search_url = "https://s.jina.ai/"
         self.reader_url = "https://r.jina.ai/"
 
-    def parse_date_to_standard(self, date_str: str) -> str:
+        # Jina API용 세션 (keep-alive로 TLS/TCP 연결 재사용)
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Authorization': f'Bearer {self.api_key}',
+            'Accept': 'application/json'
+        })
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20)
+        self.session.mount('https://', adapter)
+
+        # Jina Reader 결과 캐시 (같은 실행 내 중복 URL 재요청 방지)
+        self._read_cache: Dict[str, Optional[Dict]] = {}
+
+        # Jina Reader 영구 캐시 디렉토리 (ETag/Last-Modified 조건부 요청용)
+        self.cache_dir = Path(cache_dir or os.getenv("NEWS_CACHE_DIR", ".news_cache"))
+
+        # 수집 배치 기준 시각 (collect_market_news 시작 시 갱신)
+        self._now = datetime.now()
+
+    def parse_date_to_standard(self, date_str: str, now: Optional[datetime] = None) -> str:
         """다양한 날짜 형식을 표준 형식(YYYY-MM-DD HH:MM:SS)으로 변환"""
         if not date_str or date_str == 'unknown':
             return '1900-01-01 00:00:00'
 
+        # "ago" 계산 기준 시각: 배치 단위로 한 번만 구한 값을 재사용
+        if now is None:
+            now = self._now
+
+        return _standardize_date(date_str, now)
+
+    def _retry_after_seconds(self, response: requests.Response) -> Optional[float]:
+        """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환"""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+
+        if value.strip().isdigit():
+            return float(value)
+
         try:
-            now = datetime.now()
-
-            # 상대 시간 처리: "4 hours ago", "1 day ago"
-            if 'ago' in date_str.lower():
-                numbers = re.findall(r'\d+', date_str)
-                if not numbers:
-                    return now.strftime('%Y-%m-%d %H:%M:%S')
-
-                value = int(numbers[0])
-                if 'hour' in date_str.lower():
-                    target_date = now - timedelta(hours=value)
-                elif 'day' in date_str.lower():
-                    target_date = now - timedelta(days=value)
-                elif 'week' in date_str.lower():
-                    target_date = now - timedelta(weeks=value)
-                elif 'month' in date_str.lower():
-                    target_date = now - timedelta(days=value * 30)
-                else:
-                    target_date = now
-                return target_date.strftime('%Y-%m-%d %H:%M:%S')
-
-            # ISO 8601 형식: "2025-10-01T08:19:28+00:00"
-            if 'T' in date_str:
-                date_part = date_str.split('+')[0].split('-')[0:3]
-                date_part = '-'.join(date_part[:3])
-                if len(date_part.split('T')) > 1:
-                    parsed_date = datetime.strptime(date_part, '%Y-%m-%dT%H:%M:%S')
-                else:
-                    parsed_date = datetime.strptime(date_part, '%Y-%m-%d')
-                return parsed_date.strftime('%Y-%m-%d %H:%M:%S')
-
-            # 일반 형식: "May 31, 2025" 또는 "2025-05-31"
-            if ',' in date_str:
-                parsed_date = datetime.strptime(date_str.strip(), '%b %d, %Y')
-            elif '-' in date_str and len(date_str) == 10:
-                parsed_date = datetime.strptime(date_str, '%Y-%m-%d')
-            else:
-                return now.strftime('%Y-%m-%d %H:%M:%S')
+            retry_at = parsedate_to_datetime(value)
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
 
-            return parsed_date.strftime('%Y-%m-%d %H:%M:%S')
+    def _backoff_delay(self, attempt: int) -> float:
+        """지수 백오프 + jitter 대기 시간 계산"""
+        delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * (2 ** attempt))
+        return delay + random.uniform(0, self.RETRY_JITTER)
 
-        except Exception as e:
-            print(f"⚠️ Date parsing error for '{date_str}': {e}")
-            return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    def _throttle_on_rate_limit(self, response: requests.Response) -> None:
+        """남은 요청 수가 한도의 10% 미만이면 미리 대기"""
+        remaining = response.headers.get('x-ratelimit-remaining')
+        limit = response.headers.get('x-ratelimit-limit')
+        if not remaining or not limit:
+            return
+
+        try:
+            remaining, limit = float(remaining), float(limit)
+        except ValueError:
+            return
+
+        if limit > 0 and remaining / limit < self.RATE_LIMIT_LOW_RATIO:
+            reset = response.headers.get('x-ratelimit-reset', '')
+            delay = float(reset) if reset.isdigit() else self.RETRY_BASE_DELAY
+            delay = min(self.RETRY_MAX_DELAY, delay)
+            logger.info(f"    ⏳ Jina rate limit low ({remaining:.0f}/{limit:.0f}), pausing {delay:.1f}s")
+            time.sleep(delay)
+
+    def _get_with_retry(self, url: str, headers: Optional[Dict] = None, timeout: int = 30) -> requests.Response:
+        """
+        Jina 세션 GET 요청 (429/5xx 및 연결 오류 시 재시도)
+
+        429 응답은 Retry-After 헤더를 우선 따르고, 그 외에는 지수 백오프 + jitter로 대기.
+        재시도를 모두 소진하면 마지막 응답을 반환하거나 마지막 예외를 다시 발생시킨다.
+        """
+        for attempt in range(self.RETRY_MAX_TRIES):
+            is_last = attempt == self.RETRY_MAX_TRIES - 1
+
+            try:
+                response = self.session.get(url, headers=headers, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if is_last:
+                    raise
+                delay = self._backoff_delay(attempt)
+                logger.warning(f"    ⚠️ Jina request failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+
+            if response.status_code not in self.RETRY_STATUS_CODES or is_last:
+                self._throttle_on_rate_limit(response)
+                return response
+
+            delay = None
+            if response.status_code == 429:
+                delay = self._retry_after_seconds(response)
+            if delay is None:
+                delay = self._backoff_delay(attempt)
+            delay = min(self.RETRY_MAX_DELAY, delay)
+
+            logger.warning(f"    ⚠️ Jina returned {response.status_code}, retrying in {delay:.1f}s")
+            time.sleep(delay)
 
     def search(self, query: str, max_results: int = 5) -> List[str]:
         """Jina Search API로 검색 수행"""
         url = f'{self.search_url}?q={query}&n={max_results}'
         headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Accept': 'application/json',
             'X-Respond-With': 'no-content'
         }
 
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self._get_with_retry(url, headers=headers, timeout=30)
             response.raise_for_status()
             data = response.json()
 
@@ -122,54 +260,155 @@ class MarketNewsCollector:
                     'date': standardized_date
                 })
 
-            print(f"  Found {len(results)} results for '{query}'")
+            logger.info(f"  Found {len(results)} results for '{query}'")
             return results
 
         except Exception as e:
-            print(f"⚠️ Search error for '{query}': {e}")
+            logger.warning(f"⚠️ Search error for '{query}': {e}")
             return []
 
     def read_url(self, url: str) -> Optional[Dict]:
-        """Jina Reader API로 URL 컨텐츠 스크래핑"""
+        """Jina Reader API로 URL 컨텐츠 스크래핑 (URL별 결과 캐시)"""
+        if url in self._read_cache:
+            return self._read_cache[url]
+
+        article = self._read_url_uncached(url)
+        self._read_cache[url] = article
+        return article
+
+    def _cache_path(self, url: str) -> Path:
+        """URL의 영구 캐시 파일 경로 (SHA1(url).json)"""
+        return self.cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def _load_cached_article(self, url: str) -> Optional[Dict]:
+        """영구 캐시에서 {etag, last_modified, article} 로드"""
+        try:
+            return json_loads(self._cache_path(url).read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _save_cached_article(self, url: str, response: requests.Response, article: Dict) -> None:
+        """검증자(ETag/Last-Modified)가 있는 응답만 영구 캐시에 저장"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._cache_path(url).write_bytes(json_dumps({
+                'etag': etag,
+                'last_modified': last_modified,
+                'article': article
+            }))
+        except OSError as e:
+            logger.warning(f"    ⚠️ Failed to write news cache for '{url}': {e}")
+
+    def _read_url_uncached(self, url: str) -> Optional[Dict]:
+        """Jina Reader API 호출 (이전 실행의 캐시가 있으면 조건부 요청)"""
         reader_url = f'{self.reader_url}{url}'
         headers = {
-            'Accept': 'application/json',
-            'Authorization': f'Bearer {self.api_key}',
             'X-Timeout': '10',
-            'X-With-Generated-Alt': 'true',
+            # 이미지는 서버에서 제거 (응답 크기 감소, 본문 2000자에 이미지 마크다운이 섞이지 않음)
+            'X-Retain-Images': 'none',
         }
 
+        cached = self._load_cached_article(url)
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
         try:
-            response = requests.get(reader_url, headers=headers, timeout=15)
+            response = self._get_with_retry(reader_url, headers=headers, timeout=15)
+
+            # 변경되지 않은 기사는 본문 없이 캐시 사용
+            if response.status_code == 304 and cached:
+                return cached['article']
+
             response.raise_for_status()
-            data = response.json()
+            page = response.json().get('data', {})
 
-            content = data.get('data', {}).get('content', '')
+            content = page.get('content', '')
             # 컨텐츠 길이 제한 (첫 2000자)
-            if len(content) > 2000:
-                content = content[:2000] + '...'
+            if len(content) > self.READER_MAX_CONTENT_CHARS:
+                content = content[:self.READER_MAX_CONTENT_CHARS] + '...'
 
-            return {
+            article = {
                 'url': url,
-                'title': data.get('data', {}).get('title', 'No title'),
-                'description': data.get('data', {}).get('description', ''),
+                'title': page.get('title', 'No title'),
+                'description': page.get('description', ''),
                 'content': content,
-                'publish_time': data.get('data', {}).get('publishedTime', 'unknown')
+                'publish_time': page.get('publishedTime', 'unknown')
             }
+            self._save_cached_article(url, response, article)
+            return article
 
         except Exception as e:
-            print(f"⚠️ Reader error for '{url}': {e}")
+            logger.warning(f"⚠️ Reader error for '{url}': {e}")
             return None
 
+    def search_result_to_article(self, result: Dict) -> Dict:
+        """검색 결과(title/description/date)를 read_url과 같은 기사 형식으로 변환"""
+        return {
+            'url': result['url'],
+            'title': result['title'],
+            'description': result['description'],
+            'content': result['description'],
+            'publish_time': result['date']
+        }
+
+    def _fetch_rss(self, url: str, headers: Optional[Dict] = None, timeout: int = 15) -> Optional[ET.Element]:
+        """RSS 피드를 가져와 XML 루트 반환 (응답이 너무 크면 None)"""
+        with requests.get(url, headers=headers, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+
+            # 비정상적으로 큰 피드는 본문을 받기 전에 거부
+            content_length = int(response.headers.get('Content-Length') or 0)
+            if content_length > self.MAX_RSS_CONTENT_LENGTH:
+                logger.warning(f"    ⚠️ RSS feed too large ({content_length} bytes), skipped: {url}")
+                return None
+
+            # Content-Length가 없거나 틀린 경우 받은 크기가 한도를 넘는 즉시 중단
+            chunks = []
+            received = 0
+            for chunk in response.iter_content(chunk_size=self.RSS_CHUNK_SIZE):
+                received += len(chunk)
+                if received > self.MAX_RSS_CONTENT_LENGTH:
+                    logger.warning(f"    ⚠️ RSS feed too large (>{self.MAX_RSS_CONTENT_LENGTH} bytes), skipped: {url}")
+                    return None
+                chunks.append(chunk)
+
+        # XML 파싱
+        return xml_fromstring(b"".join(chunks))
+
+    def collect_jina_articles(self, queries: List[str], fetch_full_content: bool = False) -> List[Optional[Dict]]:
+        """
+        여러 Jina 검색 쿼리를 병렬로 실행하고 쿼리당 첫 번째 결과를 기사로 변환
+
+        Returns:
+            queries와 같은 순서의 기사 리스트 (결과가 없으면 None)
+        """
+        with ThreadPoolExecutor(max_workers=self.JINA_MAX_WORKERS) as executor:
+            # 1단계: 모든 검색을 동시에 실행
+            search_results = list(executor.map(lambda q: self.search(q, max_results=2), queries))
+            first_hits = [results[0] if results else None for results in search_results]
+
+            if not fetch_full_content:
+                return [self.search_result_to_article(hit) if hit else None for hit in first_hits]
+
+            # 2단계: 첫 번째 결과의 본문을 동시에 읽기
+            return list(executor.map(lambda hit: self.read_url(hit['url']) if hit else None, first_hits))
+
     def fetch_cnbc_stock_news(self, max_news: int = 10) -> List[Dict]:
         """CNBC 주식 뉴스 RSS 피드에서 뉴스 가져오기"""
         try:
-            print(f"  Fetching CNBC stock news from RSS...")
-            response = requests.get(self.CNBC_STOCK_NEWS_RSS_URL, timeout=15)
-            response.raise_for_status()
+            logger.info(f"  Fetching CNBC stock news from RSS...")
+            root = self._fetch_rss(self.CNBC_STOCK_NEWS_RSS_URL, timeout=15)
+            if root is None:
+                return []
 
-            # XML 파싱
-            root = ET.fromstring(response.content)
             news_items = []
 
             # RSS 2.0 형식 파싱
@@ -198,7 +437,7 @@ class MarketNewsCollector:
                         if dt:
                             publish_time = dt.strftime('%Y-%m-%d %H:%M:%S')
                     except Exception as e:
-                        print(f"    ⚠️ Date parsing error: {e}")
+                        logger.warning(f"    ⚠️ Date parsing error: {e}")
                         publish_time = self.parse_date_to_standard(pub_date.text)
 
                 # description과 content 길이 제한 (500자)
@@ -215,11 +454,11 @@ class MarketNewsCollector:
                     'source': 'CNBC Stock News'
                 })
 
-            print(f"    ✓ Found {len(news_items)} CNBC stock news items")
+            logger.info(f"    ✓ Found {len(news_items)} CNBC stock news items")
             return news_items
 
         except Exception as e:
-            print(f"⚠️ CNBC RSS fetch error: {e}")
+            logger.warning(f"⚠️ CNBC RSS fetch error: {e}")
             return []
 
     def fetch_nasdaq_stock_news(self, symbol: str, max_news: int = 5) -> List[Dict]:
@@ -231,11 +470,10 @@ class MarketNewsCollector:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
-            response = requests.get(rss_url, headers=headers, timeout=30)
-            response.raise_for_status()
+            root = self._fetch_rss(rss_url, headers=headers, timeout=30)
+            if root is None:
+                return []
 
-            # XML 파싱
-            root = ET.fromstring(response.content)
             news_items = []
 
             # RSS 2.0 형식 파싱
@@ -264,7 +502,7 @@ class MarketNewsCollector:
                         if dt:
                             publish_time = dt.strftime('%Y-%m-%d %H:%M:%S')
                     except Exception as e:
-                        print(f"    ⚠️ Date parsing error: {e}")
+                        logger.warning(f"    ⚠️ Date parsing error: {e}")
                         publish_time = self.parse_date_to_standard(pub_date.text)
 
                 # description과 content 길이 제한 (500자)
@@ -284,18 +522,17 @@ class MarketNewsCollector:
             return news_items
 
         except Exception as e:
-            print(f"    ⚠️ NASDAQ RSS fetch error for {symbol}: {e}")
+            logger.warning(f"    ⚠️ NASDAQ RSS fetch error for {symbol}: {e}")
             return []
 
     def fetch_kagi_business_news(self, max_news: int = 10) -> List[Dict]:
         """Kagi 비즈니스 뉴스 RSS 피드에서 뉴스 가져오기"""
         try:
-            print(f"  Fetching Kagi business news from RSS...")
-            response = requests.get(self.KAGI_BUSINESS_RSS_URL, timeout=15)
-            response.raise_for_status()
+            logger.info(f"  Fetching Kagi business news from RSS...")
+            root = self._fetch_rss(self.KAGI_BUSINESS_RSS_URL, timeout=15)
+            if root is None:
+                return []
 
-            # XML 파싱
-            root = ET.fromstring(response.content)
             news_items = []
 
             # RSS 2.0 형식 파싱
@@ -324,7 +561,7 @@ class MarketNewsCollector:
                         if dt:
                             publish_time = dt.strftime('%Y-%m-%d %H:%M:%S')
                     except Exception as e:
-                        print(f"    ⚠️ Date parsing error: {e}")
+                        logger.warning(f"    ⚠️ Date parsing error: {e}")
                         publish_time = self.parse_date_to_standard(pub_date.text)
 
                 # description과 content 길이 제한 (500자)
@@ -341,22 +578,21 @@ class MarketNewsCollector:
                     'source': 'Kagi Business News'
                 })
 
-            print(f"    ✓ Found {len(news_items)} business news items")
+            logger.info(f"    ✓ Found {len(news_items)} business news items")
             return news_items
 
         except Exception as e:
-            print(f"⚠️ Kagi RSS fetch error: {e}")
+            logger.warning(f"⚠️ Kagi RSS fetch error: {e}")
             return []
 
     def fetch_semiconductor_news(self, max_news: int = 10) -> List[Dict]:
         """Semiconductor Today RSS 피드에서 반도체 뉴스 가져오기"""
         try:
-            print(f"  Fetching semiconductor news from RSS...")
-            response = requests.get(self.SEMICONDUCTOR_RSS_URL, timeout=15)
-            response.raise_for_status()
+            logger.info(f"  Fetching semiconductor news from RSS...")
+            root = self._fetch_rss(self.SEMICONDUCTOR_RSS_URL, timeout=15)
+            if root is None:
+                return []
 
-            # XML 파싱
-            root = ET.fromstring(response.content)
             news_items = []
 
             # RSS 2.0 형식 파싱
@@ -385,7 +621,7 @@ class MarketNewsCollector:
                         if dt:
                             publish_time = dt.strftime('%Y-%m-%d %H:%M:%S')
                     except Exception as e:
-                        print(f"    ⚠️ Date parsing error: {e}")
+                        logger.warning(f"    ⚠️ Date parsing error: {e}")
                         publish_time = self.parse_date_to_standard(pub_date.text)
 
                 # description과 content 길이 제한 (500자)
@@ -402,22 +638,21 @@ class MarketNewsCollector:
                     'source': 'Semiconductor Today'
                 })
 
-            print(f"    ✓ Found {len(news_items)} semiconductor news items")
+            logger.info(f"    ✓ Found {len(news_items)} semiconductor news items")
             return news_items
 
         except Exception as e:
-            print(f"⚠️ Semiconductor RSS fetch error: {e}")
+            logger.warning(f"⚠️ Semiconductor RSS fetch error: {e}")
             return []
 
     def fetch_kagi_tech_news(self, max_news: int = 10) -> List[Dict]:
         """Kagi 기술 뉴스 RSS 피드에서 뉴스 가져오기"""
         try:
-            print(f"  Fetching Kagi tech news from RSS...")
-            response = requests.get(self.KAGI_TECH_RSS_URL, timeout=15)
-            response.raise_for_status()
+            logger.info(f"  Fetching Kagi tech news from RSS...")
+            root = self._fetch_rss(self.KAGI_TECH_RSS_URL, timeout=15)
+            if root is None:
+                return []
 
-            # XML 파싱
-            root = ET.fromstring(response.content)
             news_items = []
 
             # RSS 2.0 형식 파싱
@@ -446,7 +681,7 @@ class MarketNewsCollector:
                         if dt:
                             publish_time = dt.strftime('%Y-%m-%d %H:%M:%S')
                     except Exception as e:
-                        print(f"    ⚠️ Date parsing error: {e}")
+                        logger.warning(f"    ⚠️ Date parsing error: {e}")
                         publish_time = self.parse_date_to_standard(pub_date.text)
 
                 # description과 content 길이 제한 (500자)
@@ -463,11 +698,11 @@ class MarketNewsCollector:
                     'source': 'Kagi Tech News'
                 })
 
-            print(f"    ✓ Found {len(news_items)} tech news items")
+            logger.info(f"    ✓ Found {len(news_items)} tech news items")
             return news_items
 
         except Exception as e:
-            print(f"⚠️ Kagi Tech RSS fetch error: {e}")
+            logger.warning(f"⚠️ Kagi Tech RSS fetch error: {e}")
             return []
 
     def get_stock_news_yfinance(self, symbol: str, max_news: int = 3) -> List[Dict]:
@@ -517,17 +752,43 @@ class MarketNewsCollector:
             return news_items
 
         except Exception as e:
-            print(f"⚠️ yfinance news error for '{symbol}': {e}")
+            logger.warning(f"⚠️ yfinance news error for '{symbol}': {e}")
             return []
 
-    def collect_market_news(self, trading_date: str, symbols: List[str], use_jina_search: bool = False) -> Dict:
-        """시장 뉴스 및 주요 종목 뉴스 수집"""
-        print(f"\n📰 Collecting market news for {trading_date}...")
-        print(f"   Jina Search: {'Enabled' if use_jina_search else 'Disabled (RSS only)'}")
+    def fetch_stock_news(self, symbol: str, yf_max: int, nasdaq_max: int) -> Tuple[List[Dict], List[Dict]]:
+        """종목 하나의 yfinance 뉴스와 NASDAQ RSS 뉴스 가져오기"""
+        yf_news_items = self.get_stock_news_yfinance(symbol, max_news=yf_max)
+        nasdaq_news_items = self.fetch_nasdaq_stock_news(symbol, max_news=nasdaq_max)
+        return yf_news_items, nasdaq_news_items
+
+    def collect_market_news(
+        self,
+        trading_date: str,
+        symbols: List[str],
+        use_jina_search: bool = False,
+        fetch_full_content: bool = False
+    ) -> Dict:
+        """
+        시장 뉴스 및 주요 종목 뉴스 수집
+
+        Args:
+            trading_date: 거래 날짜
+            symbols: 종목 심볼 리스트
+            use_jina_search: Jina Search로 시장/섹터 뉴스 추가 수집 여부
+            fetch_full_content: Jina Reader로 본문까지 가져올지 여부
+                (False면 검색 결과의 description만 사용하여 추가 HTTP 요청 생략)
+        """
+        logger.info(f"\n📰 Collecting market news for {trading_date}...")
+        logger.info(f"   Jina Search: {'Enabled' if use_jina_search else 'Disabled (RSS only)'}")
+        if use_jina_search:
+            logger.info(f"   Jina Reader: {'Full content' if fetch_full_content else 'Disabled (search description only)'}")
+
+        # 배치 기준 시각을 한 번만 구해 모든 기사에서 재사용
+        self._now = datetime.now()
 
         news_data = {
             'trading_date': trading_date,
-            'collected_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'collected_at': self._now.strftime('%Y-%m-%d %H:%M:%S'),
             'market_overview': [],
             'sector_news': [],
             'top_stocks_news': {}
@@ -538,17 +799,17 @@ class MarketNewsCollector:
         cnbc_max = 5
 
         # 1. Kagi 비즈니스 뉴스 수집 (항상 실행)
-        print("\n1️⃣ Collecting Kagi business news...")
+        logger.info("\n1️⃣ Collecting Kagi business news...")
         kagi_news = self.fetch_kagi_business_news(max_news=kagi_max)
         news_data['market_overview'].extend(kagi_news)
 
         # 1-2. CNBC 주식 뉴스 수집 (항상 실행)
-        print("\n1-2️⃣ Collecting CNBC stock news...")
+        logger.info("\n1-2️⃣ Collecting CNBC stock news...")
         cnbc_news = self.fetch_cnbc_stock_news(max_news=cnbc_max)
         news_data['market_overview'].extend(cnbc_news)
 
         # 1-3. 섹터 뉴스 수집 (RSS - 항상 실행)
-        print("\n1-3️⃣ Collecting sector news from RSS...")
+        logger.info("\n1-3️⃣ Collecting sector news from RSS...")
 
         # Semiconductor 뉴스
         semiconductor_max = 5
@@ -562,41 +823,36 @@ class MarketNewsCollector:
 
         # 2. 전체 시장 뉴스 (Jina Search 사용 시에만)
         if use_jina_search and self.has_jina_api:
-            print("\n2️⃣ Collecting general market news via Jina Search...")
+            logger.info("\n2️⃣ Collecting general market & sector news via Jina Search...")
             market_queries = [
                 "NASDAQ stock market news today",
                 "US stock market outlook",
                 "tech stocks market analysis"
             ]
 
-            for query in market_queries:
-                results = self.search(query, max_results=2)
-                for result in results[:1]:  # 각 쿼리당 1개씩만
-                    article = self.read_url(result['url'])
-                    if article:
-                        news_data['market_overview'].append(article)
-
             # 3. 섹터 뉴스
-            print("\n3️⃣ Collecting sector news via Jina Search...")
             sector_queries = [
                 "technology sector stocks",
                 "semiconductor industry news"
             ]
 
-            for query in sector_queries:
-                results = self.search(query, max_results=2)
-                for result in results[:1]:
-                    article = self.read_url(result['url'])
-                    if article:
-                        news_data['sector_news'].append(article)
+            # 시장/섹터 쿼리를 한 번에 병렬 처리 (쿼리 순서 유지)
+            articles = self.collect_jina_articles(market_queries + sector_queries, fetch_full_content)
+            for query, article in zip(market_queries + sector_queries, articles):
+                if not article:
+                    continue
+                if query in market_queries:
+                    news_data['market_overview'].append(article)
+                else:
+                    news_data['sector_news'].append(article)
         else:
             if not use_jina_search:
-                print("\n⏭️  Skipping Jina Search (disabled by USE_JINA_SEARCH=false)")
+                logger.info("\n⏭️  Skipping Jina Search (disabled by USE_JINA_SEARCH=false)")
             else:
-                print("\n⏭️  Skipping Jina Search (no JINA API key)")
+                logger.info("\n⏭️  Skipping Jina Search (no JINA API key)")
 
         # 4. 주요 종목 뉴스 - yfinance + NASDAQ RSS 사용
-        print("\n4️⃣ Collecting top stocks news (using yfinance + NASDAQ RSS)...")
+        logger.info("\n4️⃣ Collecting top stocks news (using yfinance + NASDAQ RSS)...")
 
         # 수집할 종목 개수: Jina 미사용 시 더 많이 수집
         num_stocks = 13 if use_jina_search else 20
@@ -606,39 +862,56 @@ class MarketNewsCollector:
         yf_max = 2 if use_jina_search else 3
         nasdaq_max = 2 if use_jina_search else 3
 
-        for symbol in top_symbols:
-            print(f"  Fetching news for {symbol}...")
-
-            # yfinance 뉴스
-            yf_news_items = self.get_stock_news_yfinance(symbol, max_news=yf_max)
-
-            # NASDAQ RSS 뉴스
-            nasdaq_news_items = self.fetch_nasdaq_stock_news(symbol, max_news=nasdaq_max)
+        # 종목별 yfinance/NASDAQ 요청을 병렬로 실행 (결과는 종목 순서대로 정리)
+        logger.info(f"  Fetching news for {len(top_symbols)} stocks...")
+        with ThreadPoolExecutor(max_workers=self.STOCK_NEWS_MAX_WORKERS) as executor:
+            stock_results = list(executor.map(
+                lambda symbol: self.fetch_stock_news(symbol, yf_max, nasdaq_max),
+                top_symbols
+            ))
 
+        for symbol, (yf_news_items, nasdaq_news_items) in zip(top_symbols, stock_results):
             # 두 소스 합치기
             all_news_items = yf_news_items + nasdaq_news_items
 
             if all_news_items:
                 news_data['top_stocks_news'][symbol] = all_news_items
-                print(f"    ✓ Found {len(all_news_items)} news items (yfinance: {len(yf_news_items)}, NASDAQ: {len(nasdaq_news_items)})")
+                logger.info(f"    ✓ {symbol}: Found {len(all_news_items)} news items (yfinance: {len(yf_news_items)}, NASDAQ: {len(nasdaq_news_items)})")
             else:
-                print(f"    ⚠ No news available")
+                logger.warning(f"    ⚠ {symbol}: No news available")
 
         # 통계 출력
-        print(f"\n✅ News collection complete:")
-        print(f"   - Market overview: {len(news_data['market_overview'])} articles")
-        print(f"   - Sector news: {len(news_data['sector_news'])} articles")
-        print(f"   - Stock news: {len(news_data['top_stocks_news'])} stocks")
+        logger.info(f"\n✅ News collection complete:")
+        logger.info(f"   - Market overview: {len(news_data['market_overview'])} articles")
+        logger.info(f"   - Sector news: {len(news_data['sector_news'])} articles")
+        logger.info(f"   - Stock news: {len(news_data['top_stocks_news'])} stocks")
 
         return news_data
 
 
+def setup_logging() -> None:
+    """뉴스 로거 설정 (단일 StreamHandler, 메시지만 출력)"""
+    if logger.handlers:
+        return
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
 def main():
     """메인 실행 함수"""
+    setup_logging()
+
     # 거래 모드 확인
     use_alpaca = os.getenv("USE_ALPACA", "false").lower() == "true"
     simulation_mode = os.getenv("SIMULATION_MODE", "true").lower() == "true"
     use_jina_search = os.getenv("USE_JINA_SEARCH", "false").lower() == "true"
+    fetch_full_content = os.getenv("FETCH_FULL_CONTENT", "false").lower() == "true"
+
+    # 현재 시각 (main 내에서 한 번만 조회)
+    now = datetime.now()
 
     # 거래 날짜
     trading_date = os.getenv("TRADING_DATE")
@@ -647,7 +920,6 @@ def main():
         if trading_datetime:
             trading_date = trading_datetime.split('T')[0] if 'T' in trading_datetime else trading_datetime.split()[0]
         else:
-            now = datetime.now()
             if now.weekday() >= 5:  # 주말
                 print("⚠️ Weekend - No trading")
                 return
@@ -655,7 +927,7 @@ def main():
     else:
         # Alpaca 모드에서 과거 날짜 입력 시 경고 (뉴스는 실시간이므로 경고만)
         if use_alpaca and not simulation_mode:
-            today = datetime.now().strftime("%Y-%m-%d")
+            today = now.strftime("%Y-%m-%d")
             if trading_date != today:
                 print(f"\n⚠️  WARNING: Collecting news for past date in Alpaca mode")
                 print(f"   Requested date: {trading_date}")
@@ -664,29 +936,21 @@ def main():
 
     print(f"📅 Trading Date: {trading_date}")
 
-    # NASDAQ 100 심볼 (prepare_trading_data.py와 동일)
-    symbols = [
-        "NVDA", "MSFT", "AAPL", "GOOG", "GOOGL", "AMZN", "META", "AVGO", "TSLA",
-        "NFLX", "PLTR", "COST", "ASML", "AMD", "CSCO", "AZN", "TMUS", "MU", "LIN",
-        "PEP", "SHOP", "APP", "INTU", "AMAT", "LRCX", "PDD", "QCOM", "ARM", "INTC",
-        "BKNG", "AMGN", "TXN", "ISRG", "GILD", "KLAC", "PANW", "ADBE", "HON",
-        "CRWD", "CEG", "ADI", "ADP", "DASH", "CMCSA", "VRTX", "MELI", "SBUX",
-        "CDNS", "ORLY", "SNPS", "MSTR", "MDLZ", "ABNB", "MRVL", "CTAS", "TRI",
-        "MAR", "MNST", "CSX", "ADSK", "PYPL", "FTNT", "AEP", "WDAY", "REGN", "ROP",
-        "NXPI", "DDOG", "AXON", "ROST", "IDXX", "EA", "PCAR", "FAST", "EXC", "TTWO",
-        "XEL", "ZS", "PAYX", "WBD", "BKR", "CPRT", "CCEP", "FANG", "TEAM", "CHTR",
-        "KDP", "MCHP", "GEHC", "VRSK", "CTSH", "CSGP", "KHC", "ODFL", "DXCM", "TTD",
-        "ON", "BIIB", "LULU", "CDW", "GFS"
-    ]
+    # NASDAQ 100 심볼
+    symbols = list(NASDAQ_100)
 
     # 뉴스 수집
     collector = MarketNewsCollector()
-    news_data = collector.collect_market_news(trading_date, symbols, use_jina_search=use_jina_search)
+    news_data = collector.collect_market_news(
+        trading_date,
+        symbols,
+        use_jina_search=use_jina_search,
+        fetch_full_content=fetch_full_content
+    )
 
     # JSON 파일로 저장
     output_file = Path("market_news.json")
-    with open(output_file, "w", encoding='utf-8') as f:
-        json.dump(news_data, f, indent=2, ensure_ascii=False)
+    output_file.write_bytes(json_dumps(news_data, indent=True))
 
     print(f"\n✅ Market news saved to: {output_file}")
 
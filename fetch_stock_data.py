@@ -3,13 +3,16 @@
 무료 API (yfinance)와 웹 스크래핑을 사용하여 데이터 수집
 """
 
-import json
 import os
 import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
-import time
+from typing import Dict, List, Optional, Union
+
+from constants import NASDAQ_100 as NASDAQ_100_SYMBOLS, NASDAQ_100_SET
+from json_utils import json_loads, json_dumps
 
 # Windows 환경에서 UTF-8 출력 설정
 if sys.platform == 'win32':
@@ -29,28 +32,162 @@ except ImportError:
     ALPACA_AVAILABLE = False
 
 
-NASDAQ_100_SYMBOLS = [
-    "NVDA", "MSFT", "AAPL", "GOOG", "GOOGL", "AMZN", "META", "AVGO", "TSLA",
-    "NFLX", "PLTR", "COST", "ASML", "AMD", "CSCO", "AZN", "TMUS", "MU", "LIN",
-    "PEP", "SHOP", "APP", "INTU", "AMAT", "LRCX", "PDD", "QCOM", "ARM", "INTC",
-    "BKNG", "AMGN", "TXN", "ISRG", "GILD", "KLAC", "PANW", "ADBE", "HON",
-    "CRWD", "CEG", "ADI", "ADP", "DASH", "CMCSA", "VRTX", "MELI", "SBUX",
-    "CDNS", "ORLY", "SNPS", "MSTR", "MDLZ", "ABNB", "MRVL", "CTAS", "TRI",
-    "MAR", "MNST", "CSX", "ADSK", "PYPL", "FTNT", "AEP", "WDAY", "REGN", "ROP",
-    "NXPI", "DDOG", "AXON", "ROST", "IDXX", "EA", "PCAR", "FAST", "EXC", "TTWO",
-    "XEL", "ZS", "PAYX", "WBD", "BKR", "CPRT", "CCEP", "FANG", "TEAM", "CHTR",
-    "KDP", "MCHP", "GEHC", "VRSK", "CTSH", "CSGP", "KHC", "ODFL", "DXCM", "TTD",
-    "ON", "BIIB", "LULU", "CDW", "GFS"
-]
+def _history_to_time_series(df) -> Dict[str, Dict]:
+    """yfinance 일봉 DataFrame을 Alpha Vantage 형식의 시계열로 변환"""
+    # iterrows 대신 컬럼 단위 변환 (pandas 내부에서 일괄 처리)
+    frame = df[["Open", "High", "Low", "Close", "Volume"]].copy()
+    frame["Volume"] = frame["Volume"].astype("int64")
+    frame.index = frame.index.strftime("%Y-%m-%d")
+
+    renamed = frame.rename(columns={
+        "Open": "1. buy price",
+        "High": "2. high",
+        "Low": "3. low",
+        "Close": "4. sell price",
+        "Volume": "5. volume"
+    }).astype(str)
+
+    return renamed.to_dict(orient="index")
+
+
+def _intraday_to_today_data(today_df) -> Dict[str, str]:
+    """오늘의 1분봉 DataFrame을 실시간 일봉 데이터로 요약"""
+    today_open = today_df.iloc[0]['Open']
+    today_high = today_df['High'].max()
+    today_low = today_df['Low'].min()
+    today_current = today_df.iloc[-1]['Close']  # 가장 최근 가격
+    today_volume = today_df['Volume'].sum()
+
+    return {
+        "1. buy price": str(today_open),
+        "2. high": str(today_high),
+        "3. low": str(today_low),
+        "4. sell price": str(today_current),  # 현재가
+        "5. volume": str(int(today_volume)),
+        "6. current price": str(today_current),  # 명시적 현재가
+        "7. is_realtime": "true"  # 실시간 데이터 플래그
+    }
+
+
+def _build_price_document(symbol: str, end_date: str, time_series: Dict[str, Dict]) -> Dict:
+    """merged.jsonl에 저장할 종목 문서 생성"""
+    return {
+        "Meta Data": {
+            "1. Information": "Daily Prices",
+            "2. Symbol": symbol,
+            "3. Last Refreshed": end_date,
+            "4. Output Size": "Compact",
+            "5. Time Zone": "US/Eastern"
+        },
+        "Time Series (Daily)": time_series
+    }
+
+
+def _split_download(df, symbols: List[str]) -> Dict:
+    """yf.download(group_by='ticker') 결과를 종목별 DataFrame으로 분리"""
+    frames = {}
+    if df is None or df.empty:
+        return frames
+
+    # 단일 종목이면 컬럼이 MultiIndex가 아닐 수 있음
+    if df.columns.nlevels == 1:
+        if len(symbols) == 1:
+            frames[symbols[0]] = df.dropna(how="all")
+        return frames
+
+    available = set(df.columns.get_level_values(0))
+    for symbol in symbols:
+        if symbol in available:
+            frames[symbol] = df[symbol].dropna(how="all")
+
+    return frames
+
+
+def fetch_stock_data_batch(
+    symbols: List[str],
+    start_date: str,
+    end_date: str,
+    today_str: Optional[str] = None
+) -> Dict[str, Dict]:
+    """yf.download 한 번으로 여러 종목의 주가 데이터 가져오기"""
+    if not YFINANCE_AVAILABLE or not symbols:
+        return {}
+
+    symbols = list(symbols)
+
+    try:
+        df = yf.download(
+            tickers=symbols,
+            start=start_date,
+            end=end_date,
+            group_by="ticker",
+            auto_adjust=True,
+            threads=True,
+            progress=False
+        )
+    except Exception as e:
+        print(f"  ❌ Batch download failed: {e}")
+        return {}
+
+    # 오늘의 실시간 데이터 (장중 현재가 포함)도 한 번에 가져오기
+    today_frames = {}
+    try:
+        today_df = yf.download(
+            tickers=symbols,
+            period="1d",
+            interval="1m",
+            group_by="ticker",
+            auto_adjust=True,
+            threads=True,
+            progress=False
+        )
+        today_frames = _split_download(today_df, symbols)
+    except Exception as e:
+        # 실시간 데이터 실패해도 과거 데이터는 유지
+        print(f"  ⚠️ Failed to fetch realtime data: {e}")
+
+    if today_str is None:
+        today_str = datetime.now().strftime("%Y-%m-%d")
+    results = {}
+
+    for symbol, symbol_df in _split_download(df, symbols).items():
+        if symbol_df.empty:
+            continue
+
+        try:
+            time_series = _history_to_time_series(symbol_df)
 
+            today_df = today_frames.get(symbol)
+            if today_df is not None and not today_df.empty:
+                time_series[today_str] = _intraday_to_today_data(today_df)
 
-def fetch_stock_data_yfinance(symbol: str, start_date: str, end_date: str) -> Optional[Dict]:
-    """yfinance를 사용하여 주가 데이터 가져오기"""
+            results[symbol] = _build_price_document(symbol, end_date, time_series)
+        except Exception as e:
+            print(f"  ⚠️ Failed to convert batch data for {symbol}: {e}")
+
+    return results
+
+
+def fetch_stock_data_yfinance(
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    ticker=None,
+    today_str: Optional[str] = None
+) -> Optional[Dict]:
+    """
+    yfinance를 사용하여 주가 데이터 가져오기 (단일 종목, 배치 실패 시 재시도용)
+
+    Args:
+        ticker: 재사용할 yf.Ticker 객체 (yf.Tickers로 만든 객체를 넘기면 세션 공유)
+        today_str: 실시간 데이터를 기록할 날짜 (없으면 현재 날짜)
+    """
     if not YFINANCE_AVAILABLE:
         return None
 
     try:
-        ticker = yf.Ticker(symbol)
+        if ticker is None:
+            ticker = yf.Ticker(symbol)
         df = ticker.history(start=start_date, end=end_date)
 
         if df.empty:
@@ -58,93 +195,134 @@ def fetch_stock_data_yfinance(symbol: str, start_date: str, end_date: str) -> Op
             return None
 
         # Alpha Vantage 형식으로 변환
-        time_series = {}
-
-        for date, row in df.iterrows():
-            date_str = date.strftime("%Y-%m-%d")
-            time_series[date_str] = {
-                "1. buy price": str(row["Open"]),
-                "2. high": str(row["High"]),
-                "3. low": str(row["Low"]),
-                "4. sell price": str(row["Close"]),
-                "5. volume": str(int(row["Volume"]))
-            }
+        time_series = _history_to_time_series(df)
 
         # 오늘의 실시간 데이터 추가 (장중 현재가 포함)
-        today_data = None
         try:
             # 오늘의 1일 데이터 가져오기 (가장 최신 정보)
             today_df = ticker.history(period="1d", interval="1m")
             if not today_df.empty:
-                today_open = today_df.iloc[0]['Open']
-                today_high = today_df['High'].max()
-                today_low = today_df['Low'].min()
-                today_current = today_df.iloc[-1]['Close']  # 가장 최근 가격
-                today_volume = today_df['Volume'].sum()
-
-                today_str = datetime.now().strftime("%Y-%m-%d")
-                today_data = {
-                    "1. buy price": str(today_open),
-                    "2. high": str(today_high),
-                    "3. low": str(today_low),
-                    "4. sell price": str(today_current),  # 현재가
-                    "5. volume": str(int(today_volume)),
-                    "6. current price": str(today_current),  # 명시적 현재가
-                    "7. is_realtime": "true"  # 실시간 데이터 플래그
-                }
-                time_series[today_str] = today_data
+                if today_str is None:
+                    today_str = datetime.now().strftime("%Y-%m-%d")
+                time_series[today_str] = _intraday_to_today_data(today_df)
         except Exception as e:
             # 실시간 데이터 실패해도 과거 데이터는 유지
             print(f"  ⚠️ Failed to fetch realtime data for {symbol}: {e}")
 
-        result = {
-            "Meta Data": {
-                "1. Information": "Daily Prices",
-                "2. Symbol": symbol,
-                "3. Last Refreshed": end_date,
-                "4. Output Size": "Compact",
-                "5. Time Zone": "US/Eastern"
-            },
-            "Time Series (Daily)": time_series
-        }
-
-        return result
+        return _build_price_document(symbol, end_date, time_series)
 
     except Exception as e:
         print(f"  ❌ Error fetching {symbol}: {e}")
         return None
 
 
-def update_merged_file(data: Dict, merged_path: Path) -> None:
-    """merged.jsonl 파일 업데이트"""
+def write_json_file(path: Path, data: Dict) -> None:
+    """JSON 파일 저장 (2칸 들여쓰기)"""
+    path.write_bytes(json_dumps(data, indent=True))
+
+
+def _merged_index_path(merged_path: Path) -> Path:
+    """merged.jsonl의 사이드카 인덱스 경로 (merged.idx)"""
+    return merged_path.with_suffix(".idx")
+
+
+def _load_merged_index(merged_path: Path, content: bytes) -> Optional[Dict[str, List[int]]]:
+    """
+    merged.idx 로드 ({symbol: [offset, length]})
+
+    인덱스에 기록된 크기/CRC가 현재 merged.jsonl과 다르면 None을 반환한다.
+    """
+    index_path = _merged_index_path(merged_path)
+    if not index_path.exists():
+        return None
+
+    try:
+        index = json_loads(index_path.read_bytes())
+    except Exception:
+        return None
+
+    if index.get("size") != len(content) or index.get("crc32") != zlib.crc32(content):
+        return None
+
+    return index.get("offsets")
+
+
+def load_merged_file(merged_path: Path) -> Dict[str, Union[Dict, bytes]]:
+    """
+    merged.jsonl 파일을 {symbol: document} 딕셔너리로 로드
+
+    인덱스(merged.idx)가 유효하면 JSON을 파싱하지 않고 각 줄을 bytes로 보관하고,
+    실제로 갱신되는 종목만 merge_price_document에서 파싱한다.
+    """
+    merged = {}
+    if not merged_path.exists():
+        return merged
+
+    content = merged_path.read_bytes()
+
+    offsets = _load_merged_index(merged_path, content)
+    if offsets is not None:
+        for sym, (offset, length) in offsets.items():
+            merged[sym] = content[offset:offset + length]
+        return merged
+
+    # 인덱스가 없거나 오래된 경우 전체 파싱
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        doc = json_loads(line)
+        sym = doc["Meta Data"]["2. Symbol"]
+        merged[sym] = doc
+    return merged
+
+
+def merge_price_document(merged: Dict[str, Union[Dict, bytes]], data: Dict) -> None:
+    """새 종목 데이터를 메모리상의 merged 딕셔너리에 병합"""
     symbol = data["Meta Data"]["2. Symbol"]
 
-    # 기존 데이터 로드
-    existing_data = {}
-    if merged_path.exists():
-        with open(merged_path, "r") as f:
-            for line in f:
-                if not line.strip():
-                    continue
-                doc = json.loads(line)
-                sym = doc["Meta Data"]["2. Symbol"]
-                existing_data[sym] = doc
-
-    # 새 데이터와 병합
-    if symbol in existing_data:
+    if symbol in merged:
+        # 아직 파싱되지 않은 기존 문서는 이 시점에 파싱
+        if isinstance(merged[symbol], bytes):
+            merged[symbol] = json_loads(merged[symbol])
+
         # 기존 시계열 데이터와 병합
-        existing_series = existing_data[symbol]["Time Series (Daily)"]
-        new_series = data["Time Series (Daily)"]
-        existing_series.update(new_series)
-        existing_data[symbol]["Time Series (Daily)"] = existing_series
-        existing_data[symbol]["Meta Data"]["3. Last Refreshed"] = data["Meta Data"]["3. Last Refreshed"]
+        merged[symbol]["Time Series (Daily)"].update(data["Time Series (Daily)"])
+        merged[symbol]["Meta Data"]["3. Last Refreshed"] = data["Meta Data"]["3. Last Refreshed"]
     else:
-        existing_data[symbol] = data
+        merged[symbol] = data
+
+
+def write_merged_file(merged: Dict[str, Union[Dict, bytes]], merged_path: Path) -> None:
+    """merged 딕셔너리를 심볼 순으로 merged.jsonl에 기록하고 인덱스 갱신"""
+    offsets = {}
+    chunks = []
+    offset = 0
 
-    # 파일에 쓰기
-    with open(merged_path, "w") as f:
-        for sym in sorted(existing_data.keys()):
-            f.write(json.dumps(existing_data[sym]) + "\n")
+    for sym in sorted(merged.keys()):
+        doc = merged[sym]
+        # 갱신되지 않은 종목은 원본 bytes를 그대로 기록
+        line = doc if isinstance(doc, bytes) else json_dumps(doc)
+        offsets[sym] = [offset, len(line)]
+        chunks.append(line)
+        chunks.append(b"\n")
+        offset += len(line) + 1
+
+    content = b"".join(chunks)
+    merged_path.write_bytes(content)
+
+    index = {
+        "size": len(content),
+        "crc32": zlib.crc32(content),
+        "offsets": offsets
+    }
+    _merged_index_path(merged_path).write_bytes(json_dumps(index))
+
+
+def update_merged_file(data: Dict, merged_path: Path) -> None:
+    """merged.jsonl 파일 업데이트 (단일 종목용, 여러 종목은 fetch_all_stocks에서 일괄 처리)"""
+    merged = load_merged_file(merged_path)
+    merge_price_document(merged, data)
+    write_merged_file(merged, merged_path)
 
 
 def fetch_all_stocks(
@@ -163,29 +341,56 @@ def fetch_all_stocks(
     success_count = 0
     failed_count = 0
 
-    for i, symbol in enumerate(symbols, 1):
-        print(f"[{i}/{len(symbols)}] Fetching {symbol}...", end=" ")
-
-        # yfinance로 데이터 가져오기
-        data = fetch_stock_data_yfinance(symbol, start_date, end_date)
-
-        if data:
-            # 개별 파일 저장
-            individual_file = output_dir / f"daily_prices_{symbol}.json"
-            with open(individual_file, "w") as f:
-                json.dump(data, f, indent=2)
-
-            # merged 파일 업데이트
-            update_merged_file(data, merged_path)
-
-            print("✅")
-            success_count += 1
-        else:
-            print("❌")
-            failed_count += 1
-
-        # API 제한 방지를 위한 지연
-        time.sleep(0.1)
+    # 기존 merged 데이터는 한 번만 읽고, 마지막에 한 번만 기록
+    merged = load_merged_file(merged_path)
+
+    # 전체 종목을 한 번에 다운로드 (누락된 종목은 개별 재시도)
+    print(f"⬇️  Batch downloading {len(symbols)} symbols...")
+    today_str = datetime.now().strftime("%Y-%m-%d")
+    batch_data = fetch_stock_data_batch(symbols, start_date, end_date, today_str=today_str)
+
+    # 배치에서 빠진 종목은 yf.Tickers 하나로 묶어 세션/쿠키를 공유하며 재시도
+    missing = [symbol for symbol in symbols if symbol not in batch_data]
+    retry_tickers = {}
+    if missing and YFINANCE_AVAILABLE:
+        print(f"🔁 Retrying {len(missing)} symbols individually...")
+        retry_tickers = yf.Tickers(" ".join(missing)).tickers
+
+    # 개별 파일 저장은 I/O 작업이므로 스레드 풀에서 병렬 처리
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        write_futures = []
+
+        for i, symbol in enumerate(symbols, 1):
+            print(f"[{i}/{len(symbols)}] Fetching {symbol}...", end=" ")
+
+            data = batch_data.get(symbol)
+            if data is None:
+                # 배치에서 빠진 종목은 단일 종목 API로 재시도
+                data = fetch_stock_data_yfinance(
+                    symbol, start_date, end_date,
+                    ticker=retry_tickers.get(symbol), today_str=today_str
+                )
+
+            if data:
+                # 개별 파일 저장
+                individual_file = output_dir / f"daily_prices_{symbol}.json"
+                write_futures.append(pool.submit(write_json_file, individual_file, data))
+
+                # merged 데이터 병합 (메모리)
+                merge_price_document(merged, data)
+
+                print("✅")
+                success_count += 1
+            else:
+                print("❌")
+                failed_count += 1
+
+        # 파일 쓰기 오류가 있으면 그대로 전파
+        for future in write_futures:
+            future.result()
+
+    # merged 파일 일괄 기록
+    write_merged_file(merged, merged_path)
 
     print(f"\n✅ Success: {success_count}")
     print(f"❌ Failed: {failed_count}")
@@ -196,11 +401,9 @@ def get_latest_trading_date() -> str:
     """최신 거래일 구하기 (오늘 또는 가장 최근 평일)"""
     now = datetime.now()
 
-    # 주말이면 금요일로
-    while now.weekday() >= 5:
-        now -= timedelta(days=1)
-
-    return now.strftime("%Y-%m-%d")
+    # 주말이면 금요일로 (토: -1일, 일: -2일)
+    offset = max(0, now.weekday() - 4)
+    return (now - timedelta(days=offset)).strftime("%Y-%m-%d")
 
 
 def update_alpaca_portfolio(data_dir: Path, signature: str = "claude-trader") -> bool:
@@ -238,19 +441,19 @@ def update_alpaca_portfolio(data_dir: Path, signature: str = "claude-trader") ->
         # 기존 포지션 읽기 (ID 추적용)
         last_id = -1
         if position_file.exists():
-            with open(position_file, "r") as f:
+            with open(position_file, "rb") as f:
                 for line in f:
                     if not line.strip():
                         continue
-                    doc = json.loads(line)
+                    doc = json_loads(line)
                     last_id = max(last_id, doc.get("id", -1))
 
         # NASDAQ 100 심볼로 포지션 구조 생성
-        position_data = {symbol: 0 for symbol in NASDAQ_100_SYMBOLS}
+        position_data = dict.fromkeys(NASDAQ_100_SYMBOLS, 0)
 
         # Alpaca 포지션으로 업데이트
         for symbol, qty in positions.items():
-            if symbol in position_data:
+            if symbol in NASDAQ_100_SET:
                 position_data[symbol] = qty
             elif symbol == 'CASH':
                 position_data['CASH'] = qty
@@ -274,8 +477,8 @@ def update_alpaca_portfolio(data_dir: Path, signature: str = "claude-trader") ->
         }
 
         # 파일에 추가
-        with open(position_file, "a") as f:
-            f.write(json.dumps(new_position) + "\n")
+        with open(position_file, "ab") as f:
+            f.write(json_dumps(new_position, append_newline=True))
 
         # 포지션 요약 출력
         holdings_count = sum(1 for symbol, qty in position_data.items()
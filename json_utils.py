@@ -0,0 +1,45 @@
+"""
+JSON 유틸리티
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json으로 대체
+"""
+
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(data):
+    """JSON 디코딩 (str 또는 bytes)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_default(obj):
+    """표준 json 대체 경로에서 NumPy 스칼라/배열 직렬화"""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj, indent: bool = False, append_newline: bool = False) -> bytes:
+    """
+    JSON 인코딩 (UTF-8 bytes 반환, NumPy 값 허용)
+
+    indent=True면 2칸 들여쓰기, append_newline=True면 JSONL 기록용으로 끝에 줄바꿈 추가
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if append_newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, option=option)
+    data = json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=_json_default)
+    if append_newline:
+        data += "\n"
+    return data.encode("utf-8")
@@ -3,14 +3,21 @@ Step 1: 트레이딩 데이터 준비
 Claude Code Action에 전달할 데이터를 JSON으로 준비
 """
 
+import functools
+import mmap
 import os
+import pickle
 import sys
-import json
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+import numpy as np
 from dotenv import load_dotenv
 
+from constants import NASDAQ_100, NASDAQ_100_SET
+from json_utils import json_loads, json_dumps
+
 # Alpaca imports
 try:
     from alpaca.trading.client import TradingClient
@@ -29,6 +36,158 @@ if sys.platform == 'win32':
 load_dotenv()
 
 
+# 초기 포지션 템플릿 (initialize_position에서 복사하여 사용)
+_EMPTY_POSITION = {**dict.fromkeys(NASDAQ_100, 0), "CASH": 0.0}
+
+
+# 미국 동부 시간 오프셋 (EDT: 서머타임, EST: 동절기)
+_EDT_OFFSET = timedelta(hours=-4)
+_EST_OFFSET = timedelta(hours=-5)
+
+# merged.jsonl 일별 데이터에 항상 있어야 하는 기본 OHLCV 필드 (없으면 데이터 손상)
+_REQUIRED_PRICE_FIELDS = frozenset((
+    "1. buy price", "2. high", "3. low", "4. sell price", "5. volume"
+))
+
+# 가격 DB 캐시에 보관할 merged.jsonl 일별 데이터 필드
+_PRICE_FIELDS = frozenset((
+    "1. buy price", "2. high", "3. low", "4. sell price",
+    "5. volume", "6. current price", "7. is_realtime"
+))
+
+
+# Claude에게 전달할 프롬프트 템플릿 (실행마다 변수 부분만 채움)
+_PROMPT_TEMPLATE = """You are an expert stock trader managing a NASDAQ 100 portfolio with a LONG-TERM VALUE INVESTING approach.
+
+**INVESTMENT PHILOSOPHY**:
+- This is a LONG-TERM investment strategy focused on building wealth over months/years
+- Prioritize companies with strong fundamentals and sustainable competitive advantages
+- Make CAUTIOUS and WELL-RESEARCHED decisions - quality over quantity
+- Short-term market volatility should not trigger panic selling or hasty decisions
+- Compound growth through patient investing is the ultimate goal
+
+**Trading Session**: {trading_datetime}
+**Date**: {date}
+{time_context}
+**Trading Schedule Context**:
+You have 3 opportunities per trading day (Mon-Fri) to analyze and make decisions:
+1. **Market Open** (9:45 AM ET) - Right after market opens, assess overnight news and opening sentiment
+2. **Mid-Day** (12:30 PM ET) - Mid-session check, evaluate morning trends and any breaking news
+3. **Market Close** (3:30 PM ET) - Final 30 minutes, review full day's action and prepare for next session
+
+**Decision Guidelines by Session**:
+- **Morning Session**: React to overnight developments and set direction for the day
+- **Mid-Day Session**: Only adjust if significant intraday developments warrant action
+- **Close Session**: Reflect on the full day's data, avoid impulsive end-of-day reactions
+- **Remember**: With 3 chances daily, you don't need to act every time - patience and selectivity are virtues
+
+**Current Portfolio** (Total: ${total_value:.2f}):
+- Cash: ${cash:.2f}
+- Holdings: {holdings_n} positions
+{news_stats}
+**Your Task**:
+1. **Analyze Market News**: Review the news data carefully
+   - General market sentiment and trends
+   - Sector-specific developments
+   - Individual stock news for holdings and potential buys
+   - **IMPORTANT**: If you need more context or verification, research additional sources
+
+2. **Conduct Additional Research** (HIGHLY ENCOURAGED):
+   - Use available tools to search for more information when needed
+   - Verify company fundamentals, earnings reports, and growth projections
+   - Check for breaking news or developments not in the provided data
+   - Look up valuations, P/E ratios, analyst ratings when considering trades
+   - Be thorough - well-informed decisions are more important than quick ones
+
+3. **Evaluate Portfolio**: Consider current positions with a long-term lens
+   - Are these companies worth holding for the next 6-12 months?
+   - Do they have sustainable competitive advantages?
+   - Is the current allocation aligned with long-term goals?
+
+4. **Make Trading Decisions**: Based on thorough fundamental analysis
+   - Buy opportunities: Strong fundamentals + long-term growth potential + reasonable valuation
+   - Sell triggers: Deteriorating fundamentals, overvaluation, or better opportunities elsewhere
+   - Hold: Often the best decision - don't trade just to trade
+
+**Data Available**:
+- `trading_data.json` contains:
+  - Portfolio positions and cash
+  - Current stock prices for all NASDAQ 100 stocks (with realtime Open/High/Low/Current)
+  - Market news (general, sector, and stock-specific)
+
+**Output Format** (MUST be valid JSON):
+{{
+  "analysis": "Your detailed market and news analysis with specific references to news items",
+  "actions": [
+    {{"action": "buy", "symbol": "AAPL", "amount": 10, "reason": "Strong earnings report"}},
+    {{"action": "sell", "symbol": "MSFT", "amount": 5, "reason": "Regulatory concerns"}}
+  ]
+}}
+
+If no trades needed:
+{{
+  "analysis": "Reason for holding based on news and market analysis",
+  "actions": []
+}}
+
+**Critical Guidelines**:
+- Base decisions on thorough fundamental analysis and comprehensive research
+- Use additional research tools liberally - verify claims and dig deeper when needed
+- Reference specific news items and research findings in your analysis
+- Consider both risks and opportunities with a long-term perspective
+- Maintain portfolio diversification for risk management
+- Remember: It's perfectly acceptable to make NO trades if conditions aren't optimal
+- Quality of decisions matters far more than quantity of trades
+
+**Long-term Investment Mindset**:
+- Ask yourself: "Would I want to hold this company for the next 1-2 years?"
+- Avoid reacting to short-term noise or market sentiment swings
+- Focus on sustainable business models and competitive advantages
+- Patient capital beats reactive trading
+
+Please analyze the data thoroughly, conduct additional research as needed, and provide your trading decision in JSON format only.
+"""
+
+_NEWS_STATS_TEMPLATE = """
+**Market Intelligence Available**:
+- {market_count} general market news articles
+- {sector_count} sector-specific news articles
+- {stock_count} individual stock news items
+
+Please carefully review the news data in trading_data.json before making decisions.
+"""
+
+_TIME_CONTEXT_TEMPLATE = """
+**Current Time**:
+- UTC: {now_utc}
+- Eastern Time: {now_et}
+- Trading Session: {current_session}
+"""
+
+
+def _iter_mmap_lines(path: Path) -> Iterator[bytes]:
+    """파일을 mmap으로 매핑하여 줄 단위 bytes 반환 (텍스트 디코딩 없이)"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while True:
+                nl = mm.find(b"\n", start)
+                if nl < 0:
+                    if start < len(mm):
+                        yield mm[start:]
+                    return
+                yield mm[start:nl]
+                start = nl + 1
+
+
+@functools.lru_cache(maxsize=4)
+def _load_news_cached(path: str, mtime_ns: int, size: int) -> Dict:
+    """market_news.json 파싱 결과 캐시 (파일 mtime/크기가 바뀌면 다시 파싱)"""
+    return json_loads(Path(path).read_bytes())
+
+
 class TradingDataPreparer:
     """트레이딩 데이터 준비 클래스"""
 
@@ -39,81 +198,104 @@ class TradingDataPreparer:
         self.position_file = self.position_dir / "position.jsonl"
         self.use_alpaca = use_alpaca
 
-        # Alpaca 클라이언트 초기화
-        self.alpaca_client = None
-        if use_alpaca and ALPACA_AVAILABLE:
-            api_key = os.getenv("ALPACA_API_KEY")
-            api_secret = os.getenv("ALPACA_API_SECRET")
-            paper = os.getenv("ALPACA_PAPER", "true").lower() == "true"
-
-            if api_key and api_secret:
-                try:
-                    self.alpaca_client = TradingClient(api_key, api_secret, paper=paper)
-                    print(f"✅ Alpaca client initialized ({'Paper' if paper else 'Live'} trading)")
-                except Exception as e:
-                    print(f"⚠️ Failed to initialize Alpaca client: {e}")
-            else:
-                print("⚠️ Alpaca API credentials not found in environment")
-
         # NASDAQ 100 심볼
-        self.symbols = [
-            "NVDA", "MSFT", "AAPL", "GOOG", "GOOGL", "AMZN", "META", "AVGO", "TSLA",
-            "NFLX", "PLTR", "COST", "ASML", "AMD", "CSCO", "AZN", "TMUS", "MU", "LIN",
-            "PEP", "SHOP", "APP", "INTU", "AMAT", "LRCX", "PDD", "QCOM", "ARM", "INTC",
-            "BKNG", "AMGN", "TXN", "ISRG", "GILD", "KLAC", "PANW", "ADBE", "HON",
-            "CRWD", "CEG", "ADI", "ADP", "DASH", "CMCSA", "VRTX", "MELI", "SBUX",
-            "CDNS", "ORLY", "SNPS", "MSTR", "MDLZ", "ABNB", "MRVL", "CTAS", "TRI",
-            "MAR", "MNST", "CSX", "ADSK", "PYPL", "FTNT", "AEP", "WDAY", "REGN", "ROP",
-            "NXPI", "DDOG", "AXON", "ROST", "IDXX", "EA", "PCAR", "FAST", "EXC", "TTWO",
-            "XEL", "ZS", "PAYX", "WBD", "BKR", "CPRT", "CCEP", "FANG", "TEAM", "CHTR",
-            "KDP", "MCHP", "GEHC", "VRSK", "CTSH", "CSGP", "KHC", "ODFL", "DXCM", "TTD",
-            "ON", "BIIB", "LULU", "CDW", "GFS"
-        ]
+        self.symbols = NASDAQ_100
+        self._symbols_set = NASDAQ_100_SET
+
+        # position.jsonl 추가 쓰기용 핸들 (첫 기록 시 열고 close()에서 fsync)
+        self._pos_fh = None
+
+        # 파싱된 merged.jsonl 디스크 캐시 (mtime 기준 무효화)
+        self.merged_file = self.data_path / "merged.jsonl"
+        self.price_db_cache_file = self.data_path / "merged.jsonl.cache.pkl"
+        self._price_db: Optional[Dict[str, Dict[str, Dict]]] = None
+
+    @functools.cached_property
+    def alpaca_client(self) -> Optional["TradingClient"]:
+        """Alpaca 클라이언트 (처음 사용할 때 한 번만 초기화)"""
+        if not (self.use_alpaca and ALPACA_AVAILABLE):
+            return None
+
+        api_key = os.getenv("ALPACA_API_KEY")
+        api_secret = os.getenv("ALPACA_API_SECRET")
+        paper = os.getenv("ALPACA_PAPER", "true").lower() == "true"
+
+        if not (api_key and api_secret):
+            print("⚠️ Alpaca API credentials not found in environment")
+            return None
+
+        try:
+            client = TradingClient(api_key, api_secret, paper=paper)
+            print(f"✅ Alpaca client initialized ({'Paper' if paper else 'Live'} trading)")
+            return client
+        except Exception as e:
+            print(f"⚠️ Failed to initialize Alpaca client: {e}")
+            return None
 
     def initialize_position(self, init_datetime: str, initial_cash: float = 10000.0) -> None:
         """초기 포지션 생성"""
-        if self.position_file.exists():
+        # 배타적 생성(xb)으로 존재 확인과 생성을 한 번에 처리
+        self.position_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            fh = open(self.position_file, "xb", buffering=1 << 20)
+        except FileExistsError:
             print(f"⚠️ Position file already exists")
             return
+        self.close()
+        self._pos_fh = fh
 
-        self.position_dir.mkdir(parents=True, exist_ok=True)
-
-        init_position = {symbol: 0 for symbol in self.symbols}
+        init_position = _EMPTY_POSITION.copy()
         init_position['CASH'] = initial_cash
 
         # datetime과 date 분리
-        init_date = init_datetime.split('T')[0] if 'T' in init_datetime else init_datetime.split()[0]
+        init_date = init_datetime[:10]
 
-        with open(self.position_file, "w") as f:
-            f.write(json.dumps({
-                "datetime": init_datetime,
-                "date": init_date,
-                "id": 0,
-                "positions": init_position
-            }) + "\n")
+        self._append_position({
+            "datetime": init_datetime,
+            "date": init_date,
+            "id": 0,
+            "positions": init_position
+        })
 
         print(f"✅ Initialized position with ${initial_cash} at {init_datetime}")
 
+    def _append_position(self, doc: Dict) -> None:
+        """position.jsonl에 한 줄 추가 (큰 버퍼로 한 번만 열어 재사용)"""
+        if self._pos_fh is None:
+            self.position_dir.mkdir(parents=True, exist_ok=True)
+            self._pos_fh = open(self.position_file, "ab", buffering=1 << 20)
+        self._pos_fh.write(json_dumps(doc, append_newline=True))
+
+    def close(self) -> None:
+        """버퍼에 남은 포지션 기록을 디스크에 반영하고 파일 닫기"""
+        if self._pos_fh is None:
+            return
+        self._pos_fh.flush()
+        os.fsync(self._pos_fh.fileno())
+        self._pos_fh.close()
+        self._pos_fh = None
+
     def get_alpaca_portfolio(self) -> Optional[Dict[str, float]]:
         """Alpaca에서 실제 포트폴리오 가져오기"""
         if not self.alpaca_client:
             return None
 
         try:
-            # 계좌 정보 가져오기
-            account = self.alpaca_client.get_account()
-
-            # 포지션 가져오기
-            positions = self.alpaca_client.get_all_positions()
+            # 계좌 정보와 포지션을 동시에 요청
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                account_future = executor.submit(self.alpaca_client.get_account)
+                positions_future = executor.submit(self.alpaca_client.get_all_positions)
+                account = account_future.result()
+                positions = positions_future.result()
 
             # 포트폴리오 딕셔너리 생성
-            portfolio = {symbol: 0.0 for symbol in self.symbols}
+            portfolio = dict.fromkeys(self.symbols, 0.0)
             portfolio['CASH'] = float(account.cash)
 
             # Alpaca 포지션을 portfolio에 반영
             for position in positions:
                 symbol = position.symbol
-                if symbol in portfolio:
+                if symbol in self._symbols_set:
                     portfolio[symbol] = float(position.qty)
 
             print(f"📊 Alpaca Portfolio loaded:")
@@ -129,7 +311,7 @@ class TradingDataPreparer:
             return None
 
     def get_latest_position(self) -> tuple[Dict[str, float], int, str, str]:
-        """최신 포지션 조회 (datetime 기준으로 정렬)"""
+        """최신 포지션 조회 (datetime 기준 최신 문서)"""
         # Alpaca 모드인 경우 실제 포트폴리오 가져오기
         if self.use_alpaca and self.alpaca_client:
             portfolio = self.get_alpaca_portfolio()
@@ -138,24 +320,16 @@ class TradingDataPreparer:
                 return portfolio, -1, None, None
 
         # 로컬 파일에서 포지션 조회
-        if not self.position_file.exists():
+        # 과거 날짜 시뮬레이션은 순서가 뒤바뀐 기록을 추가하므로 마지막 줄이 아닌 datetime 최댓값 사용
+        # (TradeExecutor.get_latest_position과 같은 기준)
+        try:
+            latest = self._scan_latest_position()
+        except FileNotFoundError:
             return {}, -1, None, None
 
-        positions = []
-        with open(self.position_file, "r") as f:
-            for line in f:
-                if not line.strip():
-                    continue
-                doc = json.loads(line)
-                positions.append(doc)
-
-        if not positions:
+        if latest is None:
             return {}, -1, None, None
 
-        # datetime 기준으로 정렬하여 최신 것 선택
-        positions.sort(key=lambda x: x.get("datetime", x.get("date", "")))
-        latest = positions[-1]
-
         return (
             latest.get("positions", {}),
             latest.get("id", -1),
@@ -163,93 +337,167 @@ class TradingDataPreparer:
             latest.get("datetime")
         )
 
-    def get_price_data(self, symbol: str, date: str) -> Optional[Dict]:
-        """로컬 데이터에서 주가 조회"""
-        merged_file = self.data_path / "merged.jsonl"
-
-        if not merged_file.exists():
-            return None
-
-        with open(merged_file, "r") as f:
+    def _scan_latest_position(self) -> Optional[Dict]:
+        """position.jsonl 전체를 스트리밍하여 datetime 기준 최신 문서 선택 (같은 값이면 나중 줄 우선)"""
+        latest = None
+        latest_key = ""
+        with open(self.position_file, "rb") as f:
             for line in f:
                 if not line.strip():
                     continue
-                doc = json.loads(line)
-                meta = doc.get("Meta Data", {})
+                doc = json_loads(line)
+                key = doc.get("datetime", doc.get("date", ""))
+                if latest is None or key >= latest_key:
+                    latest, latest_key = doc, key
+        return latest
 
-                if meta.get("2. Symbol") != symbol:
-                    continue
+    @staticmethod
+    def _parse_day_data(symbol: str, date: str, day_data: Dict) -> Dict:
+        """
+        merged.jsonl의 일별 데이터를 가격 정보 딕셔너리로 변환
+
+        기본 OHLCV 필드가 없으면 데이터 손상이므로 KeyError를 발생시킨다.
+        """
+        close = float(day_data["4. sell price"])
+
+        # 실시간 데이터 여부 확인
+        is_realtime = day_data.get("7. is_realtime", "false") == "true"
+
+        # 현재가: 실시간 데이터면 current price 사용, 아니면 close 사용
+        current_price = float(day_data["6. current price"]) if "6. current price" in day_data else close
+
+        return {
+            "symbol": symbol,
+            "date": date,
+            "open": float(day_data["1. buy price"]),
+            "high": float(day_data["2. high"]),
+            "low": float(day_data["3. low"]),
+            "close": close,
+            "current_price": current_price,  # 현재가 (가장 중요)
+            "is_realtime": is_realtime,
+            "volume": int(day_data["5. volume"])
+        }
 
-                series = doc.get("Time Series (Daily)", {})
-                day_data = series.get(date)
+    def _build_price_db(self) -> Dict[str, Dict[str, Dict]]:
+        """merged.jsonl을 한 번 스트리밍하여 {심볼: {날짜: 일별 데이터}} 생성 (가격 필드만 보관)"""
+        db: Dict[str, Dict[str, Dict]] = {}
+        for line in _iter_mmap_lines(self.merged_file):
+            if not line.strip():
+                continue
+            doc = json_loads(line)
+            symbol = doc.get("Meta Data", {}).get("2. Symbol")
+            if not symbol:
+                continue
+
+            series = {
+                day: {key: value for key, value in day_data.items() if key in _PRICE_FIELDS}
+                for day, day_data in doc.get("Time Series (Daily)", {}).items()
+            }
+            existing = db.get(symbol)
+            if existing is None:
+                db[symbol] = series
+            else:
+                # 같은 심볼이 여러 번 나오면 기존처럼 날짜별로 처음 매칭된 데이터 사용
+                for day, day_data in series.items():
+                    existing.setdefault(day, day_data)
+        return db
 
-                if day_data:
-                    # 실시간 데이터 여부 확인
-                    is_realtime = day_data.get("7. is_realtime", "false") == "true"
+    def _get_price_db(self) -> Dict[str, Dict[str, Dict]]:
+        """파싱된 가격 DB 조회 (merged.jsonl의 mtime/크기가 같으면 pickle 캐시 사용)"""
+        if self._price_db is not None:
+            return self._price_db
 
-                    # 현재가: 실시간 데이터면 current price 사용, 아니면 close 사용
-                    current_price = float(day_data.get("6. current price", day_data.get("4. sell price", 0)))
+        try:
+            stat = os.stat(self.merged_file)
+        except FileNotFoundError:
+            self._price_db = {}
+            return self._price_db
 
-                    return {
-                        "symbol": symbol,
-                        "date": date,
-                        "open": float(day_data.get("1. buy price", 0)),
-                        "high": float(day_data.get("2. high", 0)),
-                        "low": float(day_data.get("3. low", 0)),
-                        "close": float(day_data.get("4. sell price", 0)),
-                        "current_price": current_price,  # 현재가 (가장 중요)
-                        "is_realtime": is_realtime,
-                        "volume": int(day_data.get("5. volume", 0))
-                    }
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+
+        try:
+            with open(self.price_db_cache_file, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    cached = pickle.loads(mm)
+            if cached.get("key") == cache_key:
+                self._price_db = cached["db"]
+                return self._price_db
+        except Exception:
+            # 캐시가 없거나 손상된 경우 다시 생성
+            pass
+
+        self._price_db = self._build_price_db()
+
+        try:
+            tmp_file = self.price_db_cache_file.with_name(self.price_db_cache_file.name + ".tmp")
+            with open(tmp_file, "wb") as f:
+                pickle.dump({"key": cache_key, "db": self._price_db}, f, protocol=5)
+            os.replace(tmp_file, self.price_db_cache_file)
+        except OSError as e:
+            print(f"⚠️ Failed to write price cache: {e}")
 
-        return None
+        return self._price_db
+
+    def get_price_data(self, symbol: str, date: str) -> Optional[Dict]:
+        """로컬 데이터에서 주가 조회"""
+        series = self._get_price_db().get(symbol)
+        day_data = series and series.get(date)
+        if not day_data:
+            return None
+        try:
+            return self._parse_day_data(symbol, date, day_data)
+        except KeyError as e:
+            print(f"⚠️ Corrupted price data for {symbol} on {date}: missing {e}")
+            return None
 
     def get_all_prices(self, date: str) -> Dict[str, float]:
         """모든 종목의 현재가 조회 (실시간 데이터 우선)"""
+        get_series = self._get_price_db().get
         prices = {}
         for symbol in self.symbols:
-            data = self.get_price_data(symbol, date)
-            if data:
-                # 현재가 우선 사용 (실시간 데이터면 current_price, 아니면 close)
-                prices[symbol] = data["current_price"]
+            day_data = get_series(symbol, {}).get(date)
+            if not day_data:
+                continue
+
+            # _parse_day_data와 같은 기준: 기본 OHLCV 필드가 없으면 손상된 데이터로 보고 건너뜀
+            if not _REQUIRED_PRICE_FIELDS <= day_data.keys():
+                missing = ", ".join(sorted(_REQUIRED_PRICE_FIELDS - day_data.keys()))
+                print(f"⚠️ Corrupted price data for {symbol} on {date}: missing {missing}")
+                continue
+
+            # 현재가 우선 사용 (실시간 데이터면 current price, 아니면 close)
+            current = day_data["6. current price"] if "6. current price" in day_data else day_data["4. sell price"]
+            prices[symbol] = float(current)
         return prices
 
     def load_market_news(self) -> Optional[Dict]:
         """시장 뉴스 데이터 로드"""
         news_file = Path("market_news.json")
-        if not news_file.exists():
+        try:
+            stat = news_file.stat()
+            return _load_news_cached(str(news_file), stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
             print("⚠️ No market news file found")
             return None
-
-        try:
-            with open(news_file, "r", encoding='utf-8') as f:
-                return json.load(f)
+        except ValueError as e:
+            print(f"⚠️ Invalid market news JSON: {e}")
+            return None
         except Exception as e:
             print(f"⚠️ Error loading market news: {e}")
             return None
 
     def get_latest_trading_date(self) -> Optional[str]:
-        """데이터에서 가장 최근 거래일 찾기"""
-        merged_file = self.data_path / "merged.jsonl"
-        if not merged_file.exists():
+        """데이터에서 가장 최근 거래일 찾기 (merged.jsonl 첫 종목 기준)"""
+        series = next(iter(self._get_price_db().values()), None)
+        if not series:
             return None
-
-        latest_date = None
-        with open(merged_file, "r") as f:
-            first_line = f.readline()
-            if first_line.strip():
-                doc = json.loads(first_line)
-                series = doc.get("Time Series (Daily)", {})
-                if series:
-                    dates = sorted(series.keys(), reverse=True)
-                    latest_date = dates[0] if dates else None
-
-        return latest_date
+        # ISO 형식 날짜 문자열이므로 사전순 최댓값이 최신 날짜
+        return max(series)
 
     def prepare_data(self, trading_datetime: str) -> Dict:
         """Claude Code Action에 전달할 데이터 준비"""
         # datetime에서 date 추출
-        date = trading_datetime.split('T')[0] if 'T' in trading_datetime else trading_datetime.split()[0]
+        date = trading_datetime[:10]
 
         print(f"📊 Preparing trading data for {trading_datetime}...")
 
@@ -264,6 +512,7 @@ class TradingDataPreparer:
             else:
                 print("📝 Initializing new position...")
                 self.initialize_position(trading_datetime)
+                self.close()
                 current_position, current_id, _, _ = self.get_latest_position()
 
         # 주가 데이터 로드 (날짜 기준)
@@ -284,29 +533,35 @@ class TradingDataPreparer:
                 print(f"❌ No trading data available in merged.jsonl")
                 return None
 
-        # 포트폴리오 가치 계산
-        total_value = current_position.get("CASH", 0)
-        holdings = []
+        # 포트폴리오 가치 계산 (보유 수량 × 현재가를 벡터 연산으로 처리)
+        symbol_count = len(self.symbols)
+        position_get = current_position.get
+        price_get = prices.get
+        shares_np = np.fromiter((position_get(s, 0) for s in self.symbols), dtype=np.float64, count=symbol_count)
+        prices_np = np.fromiter((price_get(s, 0.0) for s in self.symbols), dtype=np.float64, count=symbol_count)
+        values_np = shares_np * prices_np
+        # 기존처럼 보유 수량이 양수인 종목만 합산 (공매도 등 음수 포지션 제외)
+        held = shares_np > 0
+        total_value = current_position.get("CASH", 0) + float(values_np[held].sum())
 
-        for symbol in self.symbols:
-            shares = current_position.get(symbol, 0)
-            if shares > 0:
-                current_price = prices.get(symbol, 0)
-                value = shares * current_price
-                total_value += value
-
-                # 상세 가격 정보 가져오기
-                price_data = self.get_price_data(symbol, date)
-                holdings.append({
-                    "symbol": symbol,
-                    "shares": shares,
-                    "current_price": current_price,  # 현재가 (가장 중요)
-                    "open": price_data.get("open", 0) if price_data else 0,
-                    "high": price_data.get("high", 0) if price_data else 0,
-                    "low": price_data.get("low", 0) if price_data else 0,
-                    "is_realtime": price_data.get("is_realtime", False) if price_data else False,
-                    "value": value
-                })
+        holdings = []
+        for i in np.nonzero(held)[0]:
+            symbol = self.symbols[i]
+            shares = current_position[symbol]
+            current_price = prices.get(symbol, 0)
+
+            # 상세 가격 정보 가져오기
+            price_data = self.get_price_data(symbol, date)
+            holdings.append({
+                "symbol": symbol,
+                "shares": shares,
+                "current_price": current_price,  # 현재가 (가장 중요)
+                "open": price_data.get("open", 0) if price_data else 0,
+                "high": price_data.get("high", 0) if price_data else 0,
+                "low": price_data.get("low", 0) if price_data else 0,
+                "is_realtime": price_data.get("is_realtime", False) if price_data else False,
+                "value": float(values_np[i])
+            })
 
         # 시장 뉴스 로드
         market_news = self.load_market_news()
@@ -349,12 +604,31 @@ class TradingDataPreparer:
         return trading_data
 
 
+def _write_output_files(files: Dict[Path, bytes]) -> None:
+    """출력 파일들을 중간 출력 없이 연달아 기록 (가능하면 os.writev 사용)"""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    writev = getattr(os, "writev", None)
+
+    for path, data in files.items():
+        fd = os.open(path, flags, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                written = writev(fd, [view]) if writev else os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+
+
 def main():
     """메인 실행 함수"""
     # 거래 모드 확인
     use_alpaca = os.getenv("USE_ALPACA", "false").lower() == "true"
     simulation_mode = os.getenv("SIMULATION_MODE", "true").lower() == "true"
 
+    # 현재 시각은 한 번만 조회하여 재사용
+    now = datetime.now()
+
     # 거래 날짜 및 시간
     trading_datetime = os.getenv("TRADING_DATETIME")
 
@@ -364,7 +638,7 @@ def main():
         if trading_date:
             # Alpaca 모드에서 과거 날짜 입력 시 경고 및 무시
             if use_alpaca and not simulation_mode:
-                today = datetime.now().strftime("%Y-%m-%d")
+                today = now.strftime("%Y-%m-%d")
                 if trading_date != today:
                     print(f"\n⚠️  WARNING: Alpaca mode cannot use past dates")
                     print(f"   Requested date: {trading_date}")
@@ -374,11 +648,9 @@ def main():
                     trading_date = today
 
             # 날짜만 있으면 현재 시간 추가
-            now = datetime.now()
             trading_datetime = f"{trading_date}T{now.strftime('%H:%M:%S')}"
         else:
             # 둘 다 없으면 현재 날짜+시간
-            now = datetime.now()
             if now.weekday() >= 5:  # 주말
                 print("⚠️ Weekend - No trading")
                 return
@@ -395,18 +667,18 @@ def main():
 
     # 데이터 준비 (Alpaca 사용 여부 전달)
     preparer = TradingDataPreparer(use_alpaca=use_alpaca)
-    trading_data = preparer.prepare_data(trading_datetime)
+    try:
+        trading_data = preparer.prepare_data(trading_datetime)
+    finally:
+        preparer.close()
 
     if not trading_data:
         print("❌ Failed to prepare data")
         return
 
-    # JSON 파일로 저장 (Claude Code Action이 읽을 수 있도록)
+    # JSON 데이터 직렬화 (Claude Code Action이 읽을 수 있도록)
     output_file = Path("trading_data.json")
-    with open(output_file, "w") as f:
-        json.dump(trading_data, f, indent=2)
-
-    print(f"\n✅ Trading data saved to: {output_file}")
+    trading_bytes = json_dumps(trading_data, indent=True)
 
     # 프롬프트도 준비
     prompt_file = Path("trading_prompt.txt")
@@ -418,25 +690,17 @@ def main():
         market_count = len(news.get('market_overview', []))
         sector_count = len(news.get('sector_news', []))
         stock_count = len(news.get('top_stocks_news', {}))
-        news_stats = f"""
-**Market Intelligence Available**:
-- {market_count} general market news articles
-- {sector_count} sector-specific news articles
-- {stock_count} individual stock news items
-
-Please carefully review the news data in trading_data.json before making decisions.
-"""
+        news_stats = _NEWS_STATS_TEMPLATE.format(
+            market_count=market_count,
+            sector_count=sector_count,
+            stock_count=stock_count
+        )
 
     # 현재 시간 계산 (UTC 및 동부 시간)
-    from datetime import timezone, timedelta
-    now_utc = datetime.now(timezone.utc)
-    et_offset = timedelta(hours=-5)  # EST (동절기)
-    # 서머타임 간단 체크: 3월 둘째 일요일 ~ 11월 첫째 일요일은 EDT (UTC-4)
+    now_utc = now.astimezone(timezone.utc)
+    # 서머타임 간단 체크: 3월 둘째 일요일 ~ 11월 첫째 일요일은 EDT (UTC-4), 그 외 EST (UTC-5)
     # 정확한 계산을 위해 pytz 사용이 이상적이지만, 간단하게 월로 근사
-    if 3 <= now_utc.month <= 10:  # 대략적인 서머타임 기간
-        et_offset = timedelta(hours=-4)  # EDT
-
-    now_et = now_utc + et_offset
+    now_et = now_utc + (_EDT_OFFSET if 3 <= now_utc.month <= 10 else _EST_OFFSET)
 
     # 세션 판단 (cron 실행 시간 고려하여 넓은 범위)
     et_hour = now_et.hour
@@ -459,105 +723,29 @@ Please carefully review the news data in trading_data.json before making decisio
     else:
         current_session = "After-Hours / Outside regular trading hours"
 
-    time_context = f"""
-**Current Time**:
-- UTC: {now_utc.strftime('%Y-%m-%d %H:%M:%S %Z')}
-- Eastern Time: {now_et.strftime('%Y-%m-%d %H:%M:%S ET')}
-- Trading Session: {current_session}
-"""
-
-    with open(prompt_file, "w") as f:
-        f.write(f"""You are an expert stock trader managing a NASDAQ 100 portfolio with a LONG-TERM VALUE INVESTING approach.
-
-**INVESTMENT PHILOSOPHY**:
-- This is a LONG-TERM investment strategy focused on building wealth over months/years
-- Prioritize companies with strong fundamentals and sustainable competitive advantages
-- Make CAUTIOUS and WELL-RESEARCHED decisions - quality over quantity
-- Short-term market volatility should not trigger panic selling or hasty decisions
-- Compound growth through patient investing is the ultimate goal
-
-**Trading Session**: {trading_data['datetime']}
-**Date**: {trading_data['date']}
-{time_context}
-**Trading Schedule Context**:
-You have 3 opportunities per trading day (Mon-Fri) to analyze and make decisions:
-1. **Market Open** (9:45 AM ET) - Right after market opens, assess overnight news and opening sentiment
-2. **Mid-Day** (12:30 PM ET) - Mid-session check, evaluate morning trends and any breaking news
-3. **Market Close** (3:30 PM ET) - Final 30 minutes, review full day's action and prepare for next session
-
-**Decision Guidelines by Session**:
-- **Morning Session**: React to overnight developments and set direction for the day
-- **Mid-Day Session**: Only adjust if significant intraday developments warrant action
-- **Close Session**: Reflect on the full day's data, avoid impulsive end-of-day reactions
-- **Remember**: With 3 chances daily, you don't need to act every time - patience and selectivity are virtues
-
-**Current Portfolio** (Total: ${trading_data['portfolio']['total_value']:.2f}):
-- Cash: ${trading_data['portfolio']['cash']:.2f}
-- Holdings: {len(trading_data['portfolio']['holdings'])} positions
-{news_stats}
-**Your Task**:
-1. **Analyze Market News**: Review the news data carefully
-   - General market sentiment and trends
-   - Sector-specific developments
-   - Individual stock news for holdings and potential buys
-   - **IMPORTANT**: If you need more context or verification, research additional sources
-
-2. **Conduct Additional Research** (HIGHLY ENCOURAGED):
-   - Use available tools to search for more information when needed
-   - Verify company fundamentals, earnings reports, and growth projections
-   - Check for breaking news or developments not in the provided data
-   - Look up valuations, P/E ratios, analyst ratings when considering trades
-   - Be thorough - well-informed decisions are more important than quick ones
-
-3. **Evaluate Portfolio**: Consider current positions with a long-term lens
-   - Are these companies worth holding for the next 6-12 months?
-   - Do they have sustainable competitive advantages?
-   - Is the current allocation aligned with long-term goals?
-
-4. **Make Trading Decisions**: Based on thorough fundamental analysis
-   - Buy opportunities: Strong fundamentals + long-term growth potential + reasonable valuation
-   - Sell triggers: Deteriorating fundamentals, overvaluation, or better opportunities elsewhere
-   - Hold: Often the best decision - don't trade just to trade
-
-**Data Available**:
-- `trading_data.json` contains:
-  - Portfolio positions and cash
-  - Current stock prices for all NASDAQ 100 stocks (with realtime Open/High/Low/Current)
-  - Market news (general, sector, and stock-specific)
-
-**Output Format** (MUST be valid JSON):
-{{
-  "analysis": "Your detailed market and news analysis with specific references to news items",
-  "actions": [
-    {{"action": "buy", "symbol": "AAPL", "amount": 10, "reason": "Strong earnings report"}},
-    {{"action": "sell", "symbol": "MSFT", "amount": 5, "reason": "Regulatory concerns"}}
-  ]
-}}
-
-If no trades needed:
-{{
-  "analysis": "Reason for holding based on news and market analysis",
-  "actions": []
-}}
-
-**Critical Guidelines**:
-- Base decisions on thorough fundamental analysis and comprehensive research
-- Use additional research tools liberally - verify claims and dig deeper when needed
-- Reference specific news items and research findings in your analysis
-- Consider both risks and opportunities with a long-term perspective
-- Maintain portfolio diversification for risk management
-- Remember: It's perfectly acceptable to make NO trades if conditions aren't optimal
-- Quality of decisions matters far more than quantity of trades
-
-**Long-term Investment Mindset**:
-- Ask yourself: "Would I want to hold this company for the next 1-2 years?"
-- Avoid reacting to short-term noise or market sentiment swings
-- Focus on sustainable business models and competitive advantages
-- Patient capital beats reactive trading
-
-Please analyze the data thoroughly, conduct additional research as needed, and provide your trading decision in JSON format only.
-""")
+    time_context = _TIME_CONTEXT_TEMPLATE.format(
+        now_utc=now_utc.strftime('%Y-%m-%d %H:%M:%S %Z'),
+        now_et=now_et.strftime('%Y-%m-%d %H:%M:%S ET'),
+        current_session=current_session
+    )
+
+    prompt = _PROMPT_TEMPLATE.format_map({
+        "trading_datetime": trading_data['datetime'],
+        "date": trading_data['date'],
+        "time_context": time_context,
+        "total_value": trading_data['portfolio']['total_value'],
+        "cash": trading_data['portfolio']['cash'],
+        "holdings_n": len(trading_data['portfolio']['holdings']),
+        "news_stats": news_stats,
+    })
+
+    # 두 출력 파일을 연달아 기록
+    _write_output_files({
+        output_file: trading_bytes,
+        prompt_file: prompt.encode("utf-8"),
+    })
 
+    print(f"\n✅ Trading data saved to: {output_file}")
     print(f"✅ Prompt saved to: {prompt_file}")
 
 
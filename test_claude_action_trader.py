@@ -3,15 +3,71 @@ Claude Code Action Trader 로컬 테스트 스크립트
 """
 
 import os
+import io
 import json
+import importlib
+import threading
+import traceback
+from contextlib import redirect_stdout, redirect_stderr
 from datetime import datetime, timedelta
 from pathlib import Path
 from dotenv import load_dotenv
 
+from json_utils import json_loads
+
 # .env 파일 로드
 load_dotenv()
 
 
+def run_script_main(module_name: str, env: dict = None, timeout: float = 30) -> tuple[bool, str, str]:
+    """
+    스크립트의 main()을 같은 프로세스에서 실행 (서브프로세스 생성 없이)
+
+    모듈은 출력 리다이렉트 전에 import한다 (Windows에서 import 시 sys.stdout.reconfigure 호출).
+    main()은 데몬 스레드에서 실행하고 timeout 초가 지나면 실패로 처리한다.
+    시간 초과된 main()은 강제 종료할 수 없으므로 테스트 스크립트 종료 시까지 백그라운드에 남는다.
+
+    Returns:
+        (성공 여부, stdout, stderr)
+    """
+    try:
+        module = importlib.import_module(module_name)
+    except Exception:
+        return False, "", traceback.format_exc()
+
+    old_env = {key: os.environ.get(key) for key in (env or {})}
+    os.environ.update(env or {})
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    result = {"success": False}
+
+    def target():
+        try:
+            module.main()
+            result["success"] = True
+        except SystemExit as e:
+            result["success"] = e.code in (None, 0)
+        except Exception:
+            traceback.print_exc()
+
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            worker = threading.Thread(target=target, daemon=True)
+            worker.start()
+            worker.join(timeout)
+    finally:
+        for key, value in old_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+    if worker.is_alive():
+        return False, stdout.getvalue(), stderr.getvalue() + f"\n⏱️ {module_name}.main() timed out after {timeout}s"
+
+    return result["success"], stdout.getvalue(), stderr.getvalue()
+
+
 def check_environment():
     """환경 설정 확인"""
     print("🔍 Checking environment...")
@@ -58,21 +114,14 @@ def test_data_fetch():
     print("="*60)
 
     try:
-        import subprocess
-        result = subprocess.run(
-            ["python", "fetch_stock_data.py"],
-            env={**os.environ, "DAYS_BACK": "7"},
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
-
-        if result.returncode == 0:
+        success, stdout, stderr = run_script_main("fetch_stock_data", env={"DAYS_BACK": "7"}, timeout=120)
+
+        if success:
             print("✅ Data fetch successful")
-            print(result.stdout[-500:])
+            print(stdout[-500:])
         else:
             print("❌ Data fetch failed")
-            print(result.stderr[-500:])
+            print((stderr or stdout)[-500:])
 
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -88,37 +137,28 @@ def test_data_preparation():
     os.environ["TRADING_DATE"] = test_date
 
     try:
-        import subprocess
-        result = subprocess.run(
-            ["python", "prepare_trading_data.py"],
-            env={**os.environ},
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        if result.returncode == 0:
+        success, stdout, stderr = run_script_main("prepare_trading_data")
+
+        if success:
             print("✅ Data preparation successful")
-            print(result.stdout)
+            print(stdout)
 
             # 생성된 파일 확인
             if Path("trading_data.json").exists():
                 print("\n📄 trading_data.json created:")
-                with open("trading_data.json") as f:
-                    data = json.load(f)
-                    print(f"   - Date: {data.get('date')}")
-                    print(f"   - Portfolio value: ${data['portfolio']['total_value']:.2f}")
-                    print(f"   - Number of prices: {len(data['market']['prices'])}")
+                data = json_loads(Path("trading_data.json").read_bytes())
+                print(f"   - Date: {data.get('date')}")
+                print(f"   - Portfolio value: ${data['portfolio']['total_value']:.2f}")
+                print(f"   - Number of prices: {len(data['market']['prices'])}")
 
             if Path("trading_prompt.txt").exists():
                 print("\n📄 trading_prompt.txt created")
-                with open("trading_prompt.txt") as f:
-                    lines = f.readlines()
-                    print(f"   - Lines: {len(lines)}")
+                line_count = Path("trading_prompt.txt").read_bytes().count(b"\n")
+                print(f"   - Lines: {line_count}")
 
         else:
             print("❌ Data preparation failed")
-            print(result.stderr)
+            print(stderr or stdout)
 
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -147,21 +187,14 @@ def test_mock_decision():
 
     # 거래 실행
     try:
-        import subprocess
-        result = subprocess.run(
-            ["python", "execute_trades.py"],
-            env={**os.environ},
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        if result.returncode == 0:
+        success, stdout, stderr = run_script_main("execute_trades")
+
+        if success:
             print("\n✅ Trade execution successful")
-            print(result.stdout)
+            print(stdout)
         else:
             print("\n❌ Trade execution failed")
-            print(result.stderr)
+            print(stderr or stdout)
 
     except Exception as e:
         print(f"❌ Error: {e}")